@@ -8,13 +8,13 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
-import tempfile
-import os
+from collections import OrderedDict
 
 # by importing QT from sgtk we ensure that
 # the code will be compatible with both PySide and PyQt.
 from sgtk.platform.qt import QtCore, QtGui
 from .downloader import DownloadRunner
+from .downloader import get_cached_thumbnail, get_thumbnail_cache_path
 from .logger import get_logger
 
 try:
@@ -23,6 +23,160 @@ except ImportError:
     from tank_vendor import six as sgutils
 
 
+# Default thumbnails, keyed by resource path and target size, shared between
+# all cards so they are only loaded and scaled once.
+_default_pixmaps = {}
+
+# Maximum number of scaled thumbnails kept in memory
+_MAX_CACHED_PIXMAPS = 256
+# Scaled thumbnails, keyed by file path and target size, shared between all
+# widgets, least recently used first.
+_cached_pixmaps = OrderedDict()
+
+
+def get_scaled_pixmap(thumb_path, size):
+    """
+    Build a pixmap from the given file path, scaled to fit into the given size
+
+    :param thumb_path: Full path to an image
+    :param size: A QSize
+    :returns: A QPixmap, or None if the image could not be loaded
+    """
+    pixmap = QtGui.QPixmap(thumb_path)
+    if pixmap.isNull():
+        return None
+    ratio = size.width() / float(size.height())
+    psize = pixmap.size()
+    pratio = psize.width() / float(psize.height())
+    if pratio > ratio:
+        return pixmap.scaledToWidth(size.width(), mode=QtCore.Qt.SmoothTransformation)
+    return pixmap.scaledToHeight(size.height(), mode=QtCore.Qt.SmoothTransformation)
+
+
+def get_default_pixmap(thumb_path, size):
+    """
+    Return a shared pixmap for the given default thumbnail, scaled to fit into
+    the given size.
+
+    :param thumb_path: Path to an image, typically a Qt resource path
+    :param size: A QSize
+    :returns: A QPixmap, or None if the image could not be loaded
+    """
+    key = (thumb_path, size.width(), size.height())
+    if key not in _default_pixmaps:
+        _default_pixmaps[key] = get_scaled_pixmap(thumb_path, size)
+    return _default_pixmaps[key]
+
+
+def get_scaled_image(thumb_path, size):
+    """
+    Build an image from the given file path, scaled to fit into the given size
+
+    Unlike get_scaled_pixmap, this can be called from any thread.
+
+    :param thumb_path: Full path to an image
+    :param size: A QSize
+    :returns: A QImage, or None if the image could not be loaded
+    """
+    image = QtGui.QImage(thumb_path)
+    if image.isNull():
+        return None
+    return image.scaled(size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+
+def get_thumbnail_pixmap(thumb_path, size):
+    """
+    Return the shared pixmap for the given thumbnail file and size, if it was
+    already loaded.
+
+    :param thumb_path: Full path to an image
+    :param size: A QSize
+    :returns: A QPixmap, or None
+    """
+    key = (thumb_path, size.width(), size.height())
+    pixmap = _cached_pixmaps.get(key)
+    if pixmap is not None:
+        _cached_pixmaps.move_to_end(key)
+    return pixmap
+
+
+def add_thumbnail_image(thumb_path, size, image):
+    """
+    Build a pixmap from the given image loaded from the given thumbnail file,
+    and share it with all widgets displaying this thumbnail with this size.
+
+    Scaled pixmaps are kept in a bounded cache, so widgets displaying the same
+    thumbnail, or re-created for it, do not load and scale it again.
+
+    This must be called from the main thread.
+
+    :param thumb_path: Full path to the image file
+    :param size: A QSize, the size the image was scaled to fit into
+    :param image: A QImage, as returned by get_scaled_image, or None
+    :returns: A QPixmap, or None if the image is None
+    """
+    if image is None:
+        return None
+    pixmap = QtGui.QPixmap.fromImage(image)
+    _cached_pixmaps[(thumb_path, size.width(), size.height())] = pixmap
+    if len(_cached_pixmaps) > _MAX_CACHED_PIXMAPS:
+        _cached_pixmaps.popitem(last=False)
+    return pixmap
+
+
+class ThumbnailLoader(QtCore.QRunnable):
+    """
+    A runner loading and scaling a thumbnail file
+
+    Decoding and scaling the image is done in the runner thread, so only the
+    conversion to a QPixmap is left to the main thread.
+    """
+
+    class _Notifier(QtCore.QObject):
+        """
+        QRunnable does not derive from QObject, so we need to have a small
+        class to be able to emit signals
+        """
+
+        image_loaded = QtCore.Signal(str, object)
+
+    def __init__(self, thumb_path, size):
+        """
+        Instantiate a new thumbnail loader
+
+        :param thumb_path: Full path to an image
+        :param size: A QSize, the image is scaled to fit into it
+        """
+        super(ThumbnailLoader, self).__init__()
+        self._thumb_path = thumb_path
+        self._size = QtCore.QSize(size)
+        self._notifier = self._Notifier()
+
+    @property
+    def image_loaded(self):
+        """
+        Return the signal from the _notifier worker instance, emitted with
+        the thumbnail path and a QImage, or None if it could not be loaded.
+
+        :returns: A QSignal
+        """
+        return self._notifier.image_loaded
+
+    def queue(self):
+        """
+        Queue this runner on the shared download thread pool
+        """
+        DownloadRunner.get_thread_pool().start(self)
+
+    def run(self):
+        """
+        Actually run the runner
+        """
+        self._notifier.image_loaded.emit(
+            self._thumb_path, get_scaled_image(self._thumb_path, self._size)
+        )
+
+
 class CardWidget(QtGui.QFrame):
     """
     Base class for Card widgets, handles downloading and selection of thumbnails.
@@ -52,13 +206,18 @@ class CardWidget(QtGui.QFrame):
         """
         super(CardWidget, self).__init__(parent, *args, **kwargs)
         self._thumbnail_requested = False
+        # The most recently requested thumbnail path, if any
+        self._thumbnail_path = None
+        # The DownloadRunner for a pending thumbnail download, if any
+        self._downloader = None
+        self._selected = False
         self._sg_entity = sg_entity
         self._logger = get_logger()
         self.ui = ui_builder()
         self.ui.setupUi(self)
         self.select_button.setVisible(False)
         self.select_button.clicked.connect(self.choose_me)
-        self.set_thumbnail(
+        self.set_default_thumbnail(
             ":/tk_multi_importcut/sg_%s_thumbnail.png"
             % (self._sg_entity["type"].lower())
         )
@@ -112,21 +271,32 @@ class CardWidget(QtGui.QFrame):
         """
         Sets this card UI 'selected' property to True
         """
-        self.setProperty("selected", True)
-        self.style().unpolish(self)
-        self.style().polish(self)
         self.select_button.setVisible(True)
+        self._set_selected(True)
 
     @QtCore.Slot()
     def unselect(self):
         """
         Sets this card UI 'selected' property to False
         """
-        self.setProperty("selected", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
         self.select_button.setVisible(False)
-        self.setStyleSheet("")
+        self._set_selected(False)
+
+    def _set_selected(self, selected):
+        """
+        Set the 'selected' property used in the style sheet, only re-polishing
+        the widget if the value actually changed.
+
+        :param selected: A boolean
+        """
+        if self._selected == selected:
+            return
+        self._selected = selected
+        self.setProperty("selected", selected)
+        # Polishing clears the style sheet caches for this widget, so the new
+        # property value is picked up without an explicit unpolish
+        self.style().polish(self)
+        self.update()
 
     @QtCore.Slot()
     def choose_me(self):
@@ -146,7 +316,8 @@ class CardWidget(QtGui.QFrame):
         :param u_path: Full path to a thumbnail file, as a unicode string
         """
         path = sgutils.ensure_str(u_path)
-        self._logger.debug("Loading thumbnail %s for %s." % (path, self.entity_name))
+        self._logger.debug("Loading thumbnail %s for %s.", path, self.entity_name)
+        self._downloader = None
         self.set_thumbnail(path)
 
     def mouseDoubleClickEvent(self, event):
@@ -193,21 +364,46 @@ class CardWidget(QtGui.QFrame):
             return
         self._thumbnail_requested = True
         if self.thumbnail_url:
+            # Use the thumbnail from the disk cache if we already have it
+            cached_path = get_cached_thumbnail(self.thumbnail_url)
+            if cached_path:
+                self.new_thumbnail(cached_path)
+                event.ignore()
+                return
             self._logger.debug(
-                "Requesting %s for %s" % (self.thumbnail_url, self.entity_name)
+                "Requesting %s for %s", self.thumbnail_url, self.entity_name
             )
-            f, path = tempfile.mkstemp()
-            os.close(f)
-            downloader = DownloadRunner(
+            downloader = DownloadRunner.queue_download(
                 sg_attachment=self.thumbnail_url,
-                path=path,
+                path=get_thumbnail_cache_path(self.thumbnail_url),
             )
             downloader.file_downloaded.connect(self.new_thumbnail)
             self.discard_download.connect(downloader.abort)
-            downloader.queue()
+            self._downloader = downloader
 
         event.ignore()
 
+    def hideEvent(self, event):
+        """
+        Discard the pending thumbnail download, if any, when the card is hidden,
+        e.g. when it is filtered out by a search. The download is requested
+        again if the card is shown later.
+
+        :param event: A QEvent
+        """
+        # Spontaneous events come from the window system, e.g. when the window
+        # is minimized, the card is likely to be shown again soon.
+        if self._downloader and not event.spontaneous():
+            self._logger.debug(
+                "Discarding %s for %s", self.thumbnail_url, self.entity_name
+            )
+            self.discard_download.emit()
+            self.discard_download.disconnect(self._downloader.abort)
+            self._downloader.file_downloaded.disconnect(self.new_thumbnail)
+            self._downloader = None
+            self._thumbnail_requested = False
+        event.ignore()
+
     def closeEvent(self, event):
         """
         Discards downloads when the widget is removed
@@ -217,36 +413,50 @@ class CardWidget(QtGui.QFrame):
         self.discard_download.emit()
         event.accept()
 
+    def set_default_thumbnail(self, thumb_path):
+        """
+        Use the given default thumbnail as icon. The pixmap is shared with all
+        other cards using the same default thumbnail.
+
+        :param thumb_path: Path to an image, typically a Qt resource path
+        """
+        pixmap = get_default_pixmap(thumb_path, self.ui.icon_label.size())
+        if pixmap:
+            self.ui.icon_label.setPixmap(pixmap)
+
     def set_thumbnail(self, thumb_path):
         """
-        Build a pixmap from the given file path and use it as icon, resizing it to
-        fit into the widget icon size
+        Use the given image file as icon, resizing it to fit into the widget
+        icon size.
+
+        The image is loaded in the background, unless it was already loaded
+        for this size.
 
         :param thumb_path: Full path to an image to use as thumbnail
         """
-        size = self.ui.icon_label.size()
-        ratio = size.width() / float(size.height())
-        pixmap = QtGui.QPixmap(thumb_path)
-        if pixmap.isNull():
-            self._logger.debug(
-                "Null pixmap %s %d %d for %s"
-                % (
-                    thumb_path,
-                    pixmap.size().width(),
-                    pixmap.size().height(),
-                    self.entity_name,
-                )
-            )
+        self._thumbnail_path = thumb_path
+        pixmap = get_thumbnail_pixmap(thumb_path, self.ui.icon_label.size())
+        if pixmap:
+            self.ui.icon_label.setPixmap(pixmap)
             return
-        psize = pixmap.size()
-        pratio = psize.width() / float(psize.height())
-        if pratio > ratio:
-            self.ui.icon_label.setPixmap(
-                pixmap.scaledToWidth(size.width(), mode=QtCore.Qt.SmoothTransformation)
-            )
-        else:
-            self.ui.icon_label.setPixmap(
-                pixmap.scaledToHeight(
-                    size.height(), mode=QtCore.Qt.SmoothTransformation
-                )
-            )
+        loader = ThumbnailLoader(thumb_path, self.ui.icon_label.size())
+        loader.image_loaded.connect(self.thumbnail_loaded)
+        loader.queue()
+
+    @QtCore.Slot(str, object)
+    def thumbnail_loaded(self, u_path, image):
+        """
+        Called when a thumbnail image was loaded for this card, use it as icon.
+
+        :param u_path: Full path to the thumbnail file, as a unicode string
+        :param image: A scaled QImage, or None if it could not be loaded
+        """
+        path = sgutils.ensure_str(u_path)
+        pixmap = add_thumbnail_image(path, self.ui.icon_label.size(), image)
+        # Ignore images for thumbnails which were replaced in the meantime
+        if path != self._thumbnail_path:
+            return
+        if not pixmap:
+            self._logger.debug("Null pixmap %s for %s", path, self.entity_name)
+            return
+        self.ui.icon_label.setPixmap(pixmap)
@@ -73,14 +73,40 @@ _STATUS_COLORS = {
 _SHOT_FIELDS = [
     "code",
     "sg_status_list",
+    "sg_cut_order",
+    "image",
+]
+# Additional fields we need to retrieve on Shots for their frame ranges, when
+# smart fields are not used
+_SHOT_RANGE_FIELDS = [
     "sg_head_in",
     "sg_tail_out",
     "sg_cut_in",
     "sg_cut_out",
+    "sg_cut_duration",
+    "sg_working_duration",
+]
+# Additional fields we need to retrieve on Shots for their frame ranges, when
+# smart fields are used
+_SHOT_SMART_RANGE_FIELDS = [
     "smart_head_in",
     "smart_tail_out",
     "smart_cut_in",
     "smart_cut_out",
-    "sg_cut_order",
-    "image",
+]
+# Fields we need to retrieve on CutItems
+_CUT_ITEM_FIELDS = [
+    "cut",
+    "timecode_cut_item_in_text",
+    "timecode_cut_item_out_text",
+    "cut_order",
+    "cut_item_in",
+    "cut_item_out",
+    "shot",
+    "cut_item_duration",
+    "cut.Cut.fps",
+    "version",
+    "version.Version.code",
+    "version.Version.entity",
+    "version.Version.image",
 ]
@@ -71,6 +71,7 @@ class CreateEntityDialog(QtGui.QDialog):
 
         self.ui.project_name_label.setText(sg_project["name"])
 
+    @QtCore.Slot()
     def emit_create_entity(self):
         """
         Send out request to create entity, then close the dialog.
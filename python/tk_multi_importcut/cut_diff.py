@@ -53,6 +53,120 @@ _DIFF_LABELS = {
 }
 
 
+class CutDiffSettings(object):
+    """
+    User settings used by CutDiff instances.
+
+    Settings are retrieved once and shared by all the CutDiff instances built
+    for a Cut summary, instead of being retrieved and stored on each of them.
+
+    Three timecode to frame mapping modes are available, which are only relevant
+    for first imports:
+    - Automatic: On first import, the timecode in is mapped to the Shot head in.
+    - Absolute: On first import, timecode in is converted to an absolute frame
+                number.
+    - Relative: On first import, timecode in is converted to an arbitrary frame
+                number specified through settings.
+
+    Subsequent imports for all modes compute an offset between the previous
+    timecode in and the new one, and apply this offset to the previous Cut
+    in value to compute the new cut in. This allows to change the mapping mode
+    without affecting existing imported Cuts. Users have the ability to import
+    Cuts without comparing to an existing one, which acts as an initial import.
+    So, if needed, they can change the mapping mode by just ignoring previous
+    imports.
+    """
+
+    __slots__ = (
+        "use_smart_fields",
+        "timecode_to_frame_mapping_mode",
+        "default_head_in",
+        "default_head_in_duration",
+        "default_tail_out_duration",
+        "default_frame_rate",
+        "timecode_mapping",
+        "frame_mapping",
+        "reinstate_shot_if_status_is",
+        "_timecode_frame_maps",
+    )
+
+    def __init__(self):
+        """
+        Instantiate a new CutDiffSettings, retrieving values from user settings.
+
+        :raises ValueError: For invalid timecode to frame mapping modes.
+        """
+        user_settings = sgtk.platform.current_bundle().user_settings
+        self.use_smart_fields = user_settings.retrieve("use_smart_fields")
+        # The values coming back from retrieve here have been validated
+        # by settings_dialog.py on their way in, so we should be good
+        self.timecode_to_frame_mapping_mode = user_settings.retrieve(
+            "timecode_to_frame_mapping"
+        )
+        if self.timecode_to_frame_mapping_mode not in [
+            _ABSOLUTE_MODE,
+            _RELATIVE_MODE,
+            _AUTOMATIC_MODE,
+        ]:
+            raise ValueError(
+                "Unknown frame mapping mode %s" % self.timecode_to_frame_mapping_mode
+            )
+        self.default_head_in = int(user_settings.retrieve("default_head_in"))
+        self.default_head_in_duration = int(
+            user_settings.retrieve("default_head_duration")
+        )
+        self.default_tail_out_duration = int(
+            user_settings.retrieve("default_tail_duration")
+        )
+        self.default_frame_rate = float(user_settings.retrieve("default_frame_rate"))
+        # The values from users settings are only used in relative mode.
+        self.timecode_mapping = None
+        self.frame_mapping = None
+        if self.timecode_to_frame_mapping_mode == _RELATIVE_MODE:
+            self.timecode_mapping = user_settings.retrieve("timecode_mapping")
+            self.frame_mapping = int(user_settings.retrieve("frame_mapping"))
+        # Only used for membership tests
+        self.reinstate_shot_if_status_is = frozenset(
+            user_settings.retrieve("reinstate_shot_if_status_is") or []
+        )
+        # Timecode to frame mappings, keyed by drop frame flag
+        self._timecode_frame_maps = {}
+
+    def get_timecode_frame_map(self, drop_frame):
+        """
+        Return the timecode to frame mapping to use for first imports.
+
+        Mapping timecodes match the given drop frame setting, so we respect
+        the drop frame setting for every new EDL.
+
+        :param drop_frame: Whether or not drop frame timecodes should be used
+        :returns: A (Timecode or None, frame) tuple
+        """
+        if drop_frame in self._timecode_frame_maps:
+            return self._timecode_frame_maps[drop_frame]
+        if self.timecode_to_frame_mapping_mode == _ABSOLUTE_MODE:
+            # If we're in absolute mode, we need to reset our tc/frame values to 0.
+            timecode_frame_map = (
+                edl.Timecode(
+                    "00:00:00:00", fps=self.default_frame_rate, drop_frame=drop_frame
+                ),
+                0,
+            )
+        elif self.timecode_to_frame_mapping_mode == _RELATIVE_MODE:
+            timecode_frame_map = (
+                edl.Timecode(
+                    self.timecode_mapping,
+                    fps=self.default_frame_rate,
+                    drop_frame=drop_frame,
+                ),
+                self.frame_mapping,
+            )
+        else:
+            timecode_frame_map = (None, self.default_head_in)
+        self._timecode_frame_maps[drop_frame] = timecode_frame_map
+        return timecode_frame_map
+
+
 class CutDiff(QtCore.QObject):
     """
     A class to retrieve differences between a previous Cut and a new one.
@@ -116,7 +230,7 @@ class CutDiff(QtCore.QObject):
     # Emitted when this CutDiff instance is discarded
     discarded = QtCore.Signal(QtCore.QObject)
 
-    def __init__(self, name, sg_shot=None, edit=None, sg_cut_item=None):
+    def __init__(self, name, sg_shot=None, edit=None, sg_cut_item=None, settings=None):
         """
         Instantiate a new Cut difference
 
@@ -124,38 +238,37 @@ class CutDiff(QtCore.QObject):
         :param sg_shot: An optional Shot dictionary, as retrieved from Flow Production Tracking
         :param edit: An optional EditEvent instance, retrieved from an EDL
         :param sg_cut_item: An optional CutItem dictionary, as retrieved from Flow Production Tracking
+        :param settings: An optional CutDiffSettings instance, retrieved from
+                         user settings if not set.
         """
         super(CutDiff, self).__init__()
         self._name = name
         self._sg_shot = sg_shot
         self._edit = edit
         self._sg_cut_item = sg_cut_item
+        # Timecodes from the CutItem, parsed on first access
+        self._tc_cut_in = None
+        self._tc_cut_out = None
         self._sg_version = None
         # Make a copy of PTR Version so we can change it if needed, e.g. when
         # editing Shot name
         if self._sg_cut_item and self._sg_cut_item["version"]:
             self._sg_version = self._sg_cut_item["version"]
         elif self._edit:
-            self._sg_version = self._edit.get_sg_version()
+            self._sg_version = self._edit._sg_version
 
-        # User settings for non-class methods
-        self._user_settings = sgtk.platform.current_bundle().user_settings
+        # User settings, typically shared with other CutDiff instances
+        self._settings = settings or CutDiffSettings()
 
         self._repeated = False
         self._diff_type = _DIFF_TYPES.NO_CHANGE
         self._cut_changes_reasons = []
-        self._use_smart_fields = self._user_settings.retrieve("use_smart_fields")
-
-        # Define empty timecode to frame mapping members and retrieve actual values
-        # in _retrieve_default_timecode_frame_mapping
-        # Please note that all CutDiff should have the same settings, so this should
-        # handled by in the CutSummary, instead of being retrieved per CutDiff here.
-        self._timecode_to_frame_mapping_mode = None
-        self._default_head_in = None
-        self._default_head_in_duration = None
-        self._default_tail_out_duration = None
-        self._timecode_frame_map = None
-        self._retrieve_default_timecode_frame_mapping()
+
+        # If we have an edit, ensure our mapping timecodes match the drop frame
+        # setting.
+        self._timecode_frame_map = self._settings.get_timecode_frame_map(
+            self._edit.drop_frame if self._edit else False
+        )
 
         # List of other entries for the same Shot
         self._siblings = None
@@ -171,74 +284,6 @@ class CutDiff(QtCore.QObject):
         """
         return _DIFF_LABELS[diff_type]
 
-    def _retrieve_default_timecode_frame_mapping(self):
-        """
-        Read timecode to frame mapping user settings and store them on this instance.
-
-        Three mapping modes are available, which are only relevant for first
-        imports:
-        - Automatic: On first import, the timecode in is mapped to the Shot head in.
-        - Absolute: On first import, timecode in is converted to an absolute frame
-                    number.
-        - Relative: On first import, timecode in is converted to an arbitrary frame
-                    number specified through settings.
-
-        Subsequent imports for all modes compute an offset between the previous
-        timecode in and the new one, and apply this offset to the previous Cut
-        in value to compute the new cut in. This allows to change the mapping mode
-        without affecting existing imported Cuts. Users have the ability to import
-        Cuts without comparing to an existing one, which acts as an initial import.
-        So, if needed, they can change the mapping mode by just ignoring previous
-        imports.
-        """
-        user_settings = sgtk.platform.current_bundle().user_settings
-        # The values coming back from retrieve here have been validated
-        # by settings_dialog.py on their way in, so we should be good
-        self._timecode_to_frame_mapping_mode = user_settings.retrieve(
-            "timecode_to_frame_mapping"
-        )
-        self._default_head_in = int(user_settings.retrieve("default_head_in"))
-        self._default_head_in_duration = int(
-            user_settings.retrieve("default_head_duration")
-        )
-        self._default_tail_out_duration = int(
-            user_settings.retrieve("default_tail_duration")
-        )
-
-        default_frame_rate = float(user_settings.retrieve("default_frame_rate"))
-
-        # If we have an edit, ensure our mapping timecodes match the drop frame setting.
-        # Note that these settings are retrieved for each new import in order to ensure
-        # that we respect the drop frame settings for every new EDL.
-        edit_drop_frame = False
-        if self.edit:
-            edit_drop_frame = self.edit.drop_frame
-
-        if self._timecode_to_frame_mapping_mode == _ABSOLUTE_MODE:
-            # If we're in absolute mode, we need to reset our tc/frame values to 0.
-            self._timecode_frame_map = (
-                edl.Timecode(
-                    "00:00:00:00", fps=default_frame_rate, drop_frame=edit_drop_frame
-                ),
-                0,
-            )
-        elif self._timecode_to_frame_mapping_mode == _RELATIVE_MODE:
-            # The values from users settings are only used in relative mode.
-            timecode_mapping = user_settings.retrieve("timecode_mapping")
-            frame_mapping = int(user_settings.retrieve("frame_mapping"))
-            self._timecode_frame_map = (
-                edl.Timecode(
-                    timecode_mapping, fps=default_frame_rate, drop_frame=edit_drop_frame
-                ),
-                frame_mapping,
-            )
-        elif self._timecode_to_frame_mapping_mode == _AUTOMATIC_MODE:
-            self._timecode_frame_map = (None, self._default_head_in)
-        else:
-            raise ValueError(
-                "Unknown frame mapping mode %s" % self._timecode_to_frame_mapping_mode
-            )
-
     def get_matching_score(self, other):
         """
         Compares this CutDiff with the other and returns a matching score, based
@@ -258,14 +303,8 @@ class CutDiff(QtCore.QObject):
             cut_out = self._edit.source_out
         else:
             cut_order = self._sg_cut_item["cut_order"]
-            cut_in = edl.Timecode(
-                self._sg_cut_item["timecode_cut_item_in_text"],
-                self._sg_cut_item["cut.Cut.fps"],
-            ).to_frame()
-            cut_out = edl.Timecode(
-                self._sg_cut_item["timecode_cut_item_out_text"],
-                self._sg_cut_item["cut.Cut.fps"],
-            ).to_frame()
+            cut_in = self.tc_cut_in.to_frame()
+            cut_out = self.tc_cut_out.to_frame()
 
         if other._edit:
             other_cut_order = other._edit.id
@@ -273,14 +312,8 @@ class CutDiff(QtCore.QObject):
             other_cut_out = other._edit.source_out
         else:
             other_cut_order = other._sg_cut_item["cut_order"]
-            other_cut_in = edl.Timecode(
-                other._sg_cut_item["timecode_cut_item_in_text"],
-                other._sg_cut_item["cut.Cut.fps"],
-            ).to_frame()
-            other_cut_out = edl.Timecode(
-                other._sg_cut_item["timecode_cut_item_out_text"],
-                other._sg_cut_item["cut.Cut.fps"],
-            ).to_frame()
+            other_cut_in = other.tc_cut_in.to_frame()
+            other_cut_out = other.tc_cut_out.to_frame()
         score = 0
         if cut_order - other_cut_order == 0:
             score += 1
@@ -323,6 +356,8 @@ class CutDiff(QtCore.QObject):
         :param sg_cut_item: A PTR CutItem dictionary or None
         """
         self._sg_cut_item = sg_cut_item
+        self._tc_cut_in = None
+        self._tc_cut_out = None
 
     @property
     def edit(self):
@@ -387,7 +422,7 @@ class CutDiff(QtCore.QObject):
         if self._sg_version:
             return self._sg_version["code"]
         if self._edit:
-            return self._edit.get_version_name()
+            return self._edit._version_name
         return None
 
     @property
@@ -434,7 +469,7 @@ class CutDiff(QtCore.QObject):
         :returns: An integer or None
         """
         if self._sg_shot:
-            if self._use_smart_fields:
+            if self._settings.use_smart_fields:
                 return self._sg_shot.get("smart_head_in")
             return self._sg_shot.get("sg_head_in")
         return None
@@ -447,7 +482,7 @@ class CutDiff(QtCore.QObject):
         :returns: An integer or None
         """
         if self._sg_shot:
-            if self._use_smart_fields:
+            if self._settings.use_smart_fields:
                 return self._sg_shot.get("smart_tail_out")
             return self._sg_shot.get("sg_tail_out")
         return None
@@ -483,12 +518,12 @@ class CutDiff(QtCore.QObject):
         nh = self.shot_head_in
         if nh is None:
             if (
-                self._timecode_to_frame_mapping_mode != _AUTOMATIC_MODE
+                self._settings.timecode_to_frame_mapping_mode != _AUTOMATIC_MODE
             ):  # Explicit timecode
                 base_tc = self._timecode_frame_map[0]
                 base_frame = self._timecode_frame_map[1]
                 cut_in = self.new_tc_cut_in.to_frame() - base_tc.to_frame() + base_frame
-                nh = cut_in - self._default_head_in_duration
+                nh = cut_in - self._settings.default_head_in_duration
             else:
                 # Use the frame number as default head in
                 nh = self._timecode_frame_map[1]
@@ -542,7 +577,7 @@ class CutDiff(QtCore.QObject):
                     # add it the earliest head in
                     return self._siblings.min_cut_in + offset
             # Default case if not repeated or first entry
-            if self._use_smart_fields:
+            if self._settings.use_smart_fields:
                 return self._sg_shot.get("smart_cut_in")
             return self._sg_shot["sg_cut_in"]
         return None
@@ -555,12 +590,16 @@ class CutDiff(QtCore.QObject):
 
         :returns: A Timecode instance or None
         """
-        if self._sg_cut_item:
-            return edl.Timecode(
+        if not self._sg_cut_item:
+            return None
+        # The value is accessed often when computing new cut values, only parse
+        # the CutItem timecode once
+        if self._tc_cut_in is None:
+            self._tc_cut_in = edl.Timecode(
                 self._sg_cut_item["timecode_cut_item_in_text"],
                 self._sg_cut_item["cut.Cut.fps"],
             )
-        return None
+        return self._tc_cut_in
 
     @property
     def tc_cut_out(self):
@@ -570,12 +609,14 @@ class CutDiff(QtCore.QObject):
 
         :returns: A Timecode instance or None
         """
-        if self._sg_cut_item:
-            return edl.Timecode(
+        if not self._sg_cut_item:
+            return None
+        if self._tc_cut_out is None:
+            self._tc_cut_out = edl.Timecode(
                 self._sg_cut_item["timecode_cut_item_out_text"],
                 self._sg_cut_item["cut.Cut.fps"],
             )
-        return None
+        return self._tc_cut_out
 
     @property
     def cut_out(self):
@@ -608,7 +649,7 @@ class CutDiff(QtCore.QObject):
                     # add it the earliest head in
                     return self._siblings.max_cut_out + offset
             # Default: not repeated or last entry
-            if self._use_smart_fields:
+            if self._settings.use_smart_fields:
                 return self._sg_shot.get("smart_cut_out")
             return self._sg_shot["sg_cut_out"]
         return None
@@ -690,7 +731,7 @@ class CutDiff(QtCore.QObject):
             return cut_in
         else:
             head_in = self.new_head_in
-            head_duration = self._default_head_in_duration
+            head_duration = self._settings.default_head_in_duration
             return head_in + head_duration
 
     @property
@@ -835,7 +876,7 @@ class CutDiff(QtCore.QObject):
                     tail_out = last.new_tail_out
         if tail_out is None:
             # Fallback to defaults
-            return self._default_tail_out_duration
+            return self._settings.default_tail_out_duration
         # tail_in would be cut_out + 1, so tail_duration would be
         # tail_out - (cut_out + 1) -1, we use a simplified formula below
         return tail_out - cut_out
@@ -999,9 +1040,7 @@ class CutDiff(QtCore.QObject):
                 self._diff_type = _DIFF_TYPES.OMITTED_IN_CUT
             return
         # We have both a Shot and an edit.
-        omitted_statuses = (
-            self._user_settings.retrieve("reinstate_shot_if_status_is") or []
-        )
+        omitted_statuses = self._settings.reinstate_shot_if_status_is
         if self._sg_shot["sg_status_list"] in omitted_statuses:
             self._diff_type = _DIFF_TYPES.REINSTATED
             return
@@ -1100,7 +1139,7 @@ class CutDiff(QtCore.QObject):
         """
         shot_details = ""
         if self.sg_shot:
-            if self._use_smart_fields:
+            if self._settings.use_smart_fields:
                 shot_details = (
                     "Name : %s, Status : %s, Head In : %s, Cut In : %s, Cut Out : %s, "
                     "Tail Out : %s, Cut Order : %s"
@@ -9,12 +9,13 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 
 import sgtk
-import tempfile
-import os
 
 from .ui.cut_diff_card import Ui_CutDiffCard
 from .cut_diff import CutDiff, _DIFF_TYPES
 from .downloader import DownloadRunner
+from .downloader import get_cached_thumbnail, get_thumbnail_cache_path
+from .card_widget import get_default_pixmap, get_thumbnail_pixmap
+from .card_widget import add_thumbnail_image, ThumbnailLoader
 from .constants import _COLORS
 
 # by importing QT from sgtk rather than directly, we ensure that
@@ -78,6 +79,8 @@ class CutDiffCard(QtGui.QFrame):
         self.ui.setupUi(self)
 
         self._thumbnail_requested = False
+        # The most recently requested thumbnail path, if any
+        self._thumbnail_path = None
         cut_diff.type_changed.connect(self.diff_type_changed)
         cut_diff.repeated_changed.connect(self.repeated_changed)
         self._set_ui_values()
@@ -91,9 +94,13 @@ class CutDiffCard(QtGui.QFrame):
         :param name: An arbitrary property
         :param value: An arbitrary value
         """
+        # Only refresh styling if the value actually changed
+        if self.property(name) == value:
+            return
         self.setProperty(name, value)
         # We need to refresh ourself and a couple of children
-        # widgets
+        # widgets. Polishing clears the style sheet caches for a widget, so the
+        # new property value is picked up without an explicit unpolish
         widgets = [
             self,
             self.ui.shot_name_line,
@@ -102,7 +109,6 @@ class CutDiffCard(QtGui.QFrame):
             self.ui.status_label,
         ]
         for w in widgets:
-            self.style().unpolish(w)
             self.style().polish(w)
 
     def _set_ui_values(self):
@@ -211,7 +217,12 @@ class CutDiffCard(QtGui.QFrame):
 
         self.set_tool_tip()
 
-        self.set_thumbnail(":/tk_multi_importcut/sg_shot_thumbnail.png")
+        # Use a default pixmap shared with all other cards
+        pixmap = get_default_pixmap(
+            ":/tk_multi_importcut/sg_shot_thumbnail.png", self.ui.icon_label.size()
+        )
+        if pixmap:
+            self.ui.icon_label.setPixmap(pixmap)
 
     @QtCore.Slot(str)
     def new_thumbnail(self, path):
@@ -243,7 +254,7 @@ class CutDiffCard(QtGui.QFrame):
         # issued from it.
         self.retrieve_thumbnail()
 
-    @QtCore.Slot(CutDiff, int, int)
+    @QtCore.Slot(CutDiff, bool, bool)
     def repeated_changed(self, cut_diff, old_repeated, new_repeated):
         """
         Called when the repeated changed for the CutDiff being displayed
@@ -394,37 +405,49 @@ class CutDiffCard(QtGui.QFrame):
         elif self._cut_diff.sg_shot and self._cut_diff.sg_shot.get("image"):
             thumb_url = self._cut_diff.sg_shot["image"]
         if thumb_url:
-            f, path = tempfile.mkstemp()
-            os.close(f)
-            downloader = DownloadRunner(
+            # Use the thumbnail from the disk cache if we already have it
+            cached_path = get_cached_thumbnail(thumb_url)
+            if cached_path:
+                self.set_thumbnail(cached_path)
+                return
+            downloader = DownloadRunner.queue_download(
                 sg_attachment=thumb_url,
-                path=path,
+                path=get_thumbnail_cache_path(thumb_url),
             )
             downloader.file_downloaded.connect(self.new_thumbnail)
             self.discard_download.connect(downloader.abort)
-            downloader.queue()
 
     def set_thumbnail(self, thumb_path):
         """
-        Build a pixmap from the given file path and use it as icon, resizing it to
-        fit into the widget icon size
+        Use the given image file as icon, resizing it to fit into the widget
+        icon size.
+
+        The image is loaded in the background, unless it was already loaded
+        for this size.
 
         :param thumb_path: Full path to an image to use as thumbnail
         """
-        size = self.ui.icon_label.size()
-        ratio = size.width() / float(size.height())
-        pixmap = QtGui.QPixmap(thumb_path)
-        if pixmap.isNull():
+        self._thumbnail_path = thumb_path
+        pixmap = get_thumbnail_pixmap(thumb_path, self.ui.icon_label.size())
+        if pixmap:
+            self.ui.icon_label.setPixmap(pixmap)
             return
-        psize = pixmap.size()
-        pratio = psize.width() / float(psize.height())
-        if pratio > ratio:
-            self.ui.icon_label.setPixmap(
-                pixmap.scaledToWidth(size.width(), mode=QtCore.Qt.SmoothTransformation)
-            )
-        else:
-            self.ui.icon_label.setPixmap(
-                pixmap.scaledToHeight(
-                    size.height(), mode=QtCore.Qt.SmoothTransformation
-                )
-            )
+        loader = ThumbnailLoader(thumb_path, self.ui.icon_label.size())
+        loader.image_loaded.connect(self.thumbnail_loaded)
+        loader.queue()
+
+    @QtCore.Slot(str, object)
+    def thumbnail_loaded(self, path, image):
+        """
+        Called when a thumbnail image was loaded for this card, use it as icon.
+
+        :param path: Full path to the thumbnail file, as a unicode string
+        :param image: A scaled QImage, or None if it could not be loaded
+        """
+        path = sgutils.ensure_str(path)
+        pixmap = add_thumbnail_image(path, self.ui.icon_label.size(), image)
+        # Ignore images for thumbnails which were replaced in the meantime
+        if path != self._thumbnail_path:
+            return
+        if pixmap:
+            self.ui.icon_label.setPixmap(pixmap)
@@ -50,24 +50,33 @@ class CutDiffsView(QtCore.QObject):
         """
         return self._info_message
 
-    @QtCore.Slot(CutDiff)
-    def new_cut_diff(self, cut_diff):
+    @QtCore.Slot(list)
+    def new_cut_diffs(self, cut_diffs):
         """
-        Called when a new cut diff card widget needs to be added to the list
+        Called when new cut diff card widgets need to be added to the list
         of retrieved changes
 
-        :param cut_diff: A CutDiff instance for whose a widget needs to be added
+        :param cut_diffs: A list of CutDiff instances for which widgets need to
+                          be added
         """
-        self._logger.debug("Adding %s" % cut_diff.name)
         self.totals_changed.emit()
-        widget = CutDiffCard(parent=None, cut_diff=cut_diff)
-
-        count = self._list_layout.count()
-        insert_index = self._get_insert_index(widget)
-        self._list_layout.insertWidget(insert_index, widget)
-        self._list_layout.setStretch(self._list_layout.count() - 1, 1)
-        # Redisplay widgets
-        self._display_for_summary_mode()
+        parent_widget = self._list_layout.parentWidget()
+        if parent_widget:
+            parent_widget.setUpdatesEnabled(False)
+        try:
+            for cut_diff in cut_diffs:
+                self._logger.debug("Adding %s", cut_diff.name)
+                widget = CutDiffCard(parent=None, cut_diff=cut_diff)
+                insert_index = self._get_insert_index(widget)
+                self._list_layout.insertWidget(insert_index, widget)
+            self._list_layout.setStretch(self._list_layout.count() - 1, 1)
+            # Redisplay widgets
+            self._display_for_summary_mode()
+        finally:
+            if parent_widget:
+                parent_widget.setUpdatesEnabled(True)
+        # Last item is a stretcher
+        count = self._list_layout.count() - 1
         self._info_message = (
             ("%d Cut Items" % count) if count > 1 else ("%d Cut Item" % count)
         )
@@ -160,7 +169,7 @@ class CutDiffsView(QtCore.QObject):
         if not activated:
             return
         self._cuts_display_mode = mode
-        self._logger.debug("Switching to %s mode" % mode)
+        self._logger.debug("Switching to %s mode", mode)
         self._display_for_summary_mode()
 
     def _display_for_summary_mode(self):
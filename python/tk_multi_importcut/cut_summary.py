@@ -9,14 +9,16 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 
 import sgtk
+import logging
 from collections import defaultdict
 
 # by importing QT from sgtk rather than directly, we ensure that
 # the code will be compatible with both PySide and PyQt.
 from sgtk.platform.qt import QtCore
-from .cut_diff import CutDiff, _DIFF_TYPES
+from .cut_diff import CutDiff, CutDiffSettings, _DIFF_TYPES
 from .logger import get_logger
 from .constants import _SHOT_FIELDS
+from .constants import _SHOT_RANGE_FIELDS, _SHOT_SMART_RANGE_FIELDS
 
 try:
     from tank_vendor import sgutils
@@ -227,36 +229,39 @@ class ShotCutDiffList(list):
 
         :returns: A tuple
         """
-        min_cut_order = None
-        min_head_in = None
-        min_cut_in = None
-        max_cut_out = None
-        max_tail_out = None
         sg_shot = None
         shot_diff_type = None
-        # Do a first pass with all entries to get min and max
+        # Do a first pass with all entries to collect values. New values are
+        # computed on each access, so they are only retrieved once, and min and
+        # max values are computed afterwards.
+        cut_orders = []
+        head_ins = []
+        cut_ins = []
+        cut_outs = []
+        tail_outs = []
         for cut_diff in self:
             if sg_shot is None and cut_diff.sg_shot:
                 sg_shot = cut_diff.sg_shot
             edit = cut_diff.edit
-            if edit and (min_cut_order is None or edit.id < min_cut_order):
-                min_cut_order = edit.id
-            if cut_diff.new_head_in is not None and (
-                min_head_in is None or cut_diff.new_head_in < min_head_in
-            ):
-                min_head_in = cut_diff.new_head_in
-            if cut_diff.new_cut_in is not None and (
-                min_cut_in is None or cut_diff.new_cut_in < min_cut_in
-            ):
-                min_cut_in = cut_diff.new_cut_in
-            if cut_diff.new_cut_out is not None and (
-                max_cut_out is None or cut_diff.new_cut_out > max_cut_out
-            ):
-                max_cut_out = cut_diff.new_cut_out
-            if cut_diff.new_tail_out is not None and (
-                max_tail_out is None or cut_diff.new_tail_out > max_tail_out
-            ):
-                max_tail_out = cut_diff.new_tail_out
+            if edit:
+                cut_orders.append(edit.id)
+            value = cut_diff.new_head_in
+            if value is not None:
+                head_ins.append(value)
+            value = cut_diff.new_cut_in
+            if value is not None:
+                cut_ins.append(value)
+            value = cut_diff.new_cut_out
+            if value is not None:
+                cut_outs.append(value)
+            value = cut_diff.new_tail_out
+            if value is not None:
+                tail_outs.append(value)
+        min_cut_order = min(cut_orders) if cut_orders else None
+        min_head_in = min(head_ins) if head_ins else None
+        min_cut_in = min(cut_ins) if cut_ins else None
+        max_cut_out = max(cut_outs) if cut_outs else None
+        max_tail_out = max(tail_outs) if tail_outs else None
         # We do a second pass for the Shot difference type, as we might stop
         # iteration at some point. Given that the number of duplicated shots is
         # usually low, there shouldn't be a big performance hit in iterating twice
@@ -398,6 +403,9 @@ class CutSummary(QtCore.QObject):
         """
         super(CutSummary, self).__init__()
         self._cut_diffs = {}
+        # User settings shared by all our CutDiff instances, retrieved when the
+        # first one is added
+        self._cut_diff_settings = None
         self._total_count = 0
         # Use a defaultdict so we don't have to worry about key existence
         self._counts = defaultdict(int)
@@ -421,7 +429,7 @@ class CutSummary(QtCore.QObject):
                 self._duration = tc_edit_out.to_frame() - self._edit_offset
 
         self._logger.info(
-            "Edit offset %s, duration %s" % (self._edit_offset, self._duration)
+            "Edit offset %s, duration %s", self._edit_offset, self._duration
         )
 
     @property
@@ -470,13 +478,53 @@ class CutSummary(QtCore.QObject):
         :param sg_cut_item: An optional Cut Item, as a dictionary retrieved from Flow Production Tracking
         :return: A new CutDiff instance
         """
+        cut_diff = self._add_cut_diff(shot_name, sg_shot, edit, sg_cut_item)
+        self._recompute_counts()
+        self.new_cut_diff.emit(cut_diff)
+        return cut_diff
+
+    def add_cut_diffs(self, entries):
+        """
+        Add new Cut differences to this summary
+
+        Counts are only recomputed once, after all the Cut differences were
+        added.
+
+        :param entries: An iterable of (shot name, PTR Shot, CutEdit, PTR CutItem)
+                        tuples, with the same meaning as add_cut_diff parameters
+        :returns: A list of new CutDiff instances
+        """
+        cut_diffs = [self._add_cut_diff(*entry) for entry in entries]
+        if cut_diffs:
+            self._recompute_counts()
+        for cut_diff in cut_diffs:
+            self.new_cut_diff.emit(cut_diff)
+        return cut_diffs
+
+    def _add_cut_diff(self, shot_name, sg_shot, edit, sg_cut_item):
+        """
+        Create a new CutDiff and store it in this summary, without recomputing
+        counts nor notifying listeners
+
+        :param shot_name: Shot name, as a string
+        :param sg_shot: A Shot, as a dictionary retrieved from Flow Production Tracking, or None
+        :param edit: A CutEdit object or None
+        :param sg_cut_item: A Cut Item, as a dictionary retrieved from Flow Production Tracking, or None
+        :returns: A new CutDiff instance
+        """
         if sg_shot is None and edit is None and sg_cut_item is None:
             raise ValueError(
                 "At least one of the Shot, Edit or CutItem must be specified"
             )
 
+        if self._cut_diff_settings is None:
+            self._cut_diff_settings = CutDiffSettings()
         cut_diff = CutDiff(
-            shot_name, sg_shot=sg_shot, edit=edit, sg_cut_item=sg_cut_item
+            shot_name,
+            sg_shot=sg_shot,
+            edit=edit,
+            sg_cut_item=sg_cut_item,
+            settings=self._cut_diff_settings,
         )
         cut_diff.name_changed.connect(self.cut_diff_name_changed)
         cut_diff.type_changed.connect(self.cut_diff_type_changed)
@@ -500,9 +548,6 @@ class CutSummary(QtCore.QObject):
             self._cut_diffs[shot_key] = ShotCutDiffList(cut_diff)
             cut_diff.set_repeated(False)
 
-        diff_type = cut_diff.diff_type
-        self._recompute_counts()
-        self.new_cut_diff.emit(cut_diff)
         return cut_diff
 
     @QtCore.Slot(CutDiff, str, str)
@@ -557,9 +602,7 @@ class CutSummary(QtCore.QObject):
         self._cut_diffs[old_shot_key].remove(cut_diff)
         # If we have a PTR Shot, and a CutItem, it is now an omitted one
         if cut_diff.sg_cut_item and cut_diff.sg_shot:
-            self._logger.debug(
-                "Adding omitted entry for old shot key %s" % old_shot_key
-            )
+            self._logger.debug("Adding omitted entry for old shot key %s", old_shot_key)
             sg_shot = cut_diff.sg_shot
             sg_cut_item = cut_diff.sg_cut_item
             self.add_cut_diff(
@@ -570,12 +613,12 @@ class CutSummary(QtCore.QObject):
             )
         count = len(self._cut_diffs[old_shot_key])
         if count == 0:
-            self._logger.debug("No more entries for old shot key %s" % old_shot_key)
-            self._logger.debug("Discarding list for old shot key %s" % old_shot_key)
+            self._logger.debug("No more entries for old shot key %s", old_shot_key)
+            self._logger.debug("Discarding list for old shot key %s", old_shot_key)
             # We can discard the list for this shot
             del self._cut_diffs[old_shot_key]
         elif count == 1:
-            self._logger.debug("Single entry for old Shot key %s" % old_shot_key)
+            self._logger.debug("Single entry for old Shot key %s", old_shot_key)
             # This guy is alone now, so not repeated
             self._cut_diffs[old_shot_key][0].set_repeated(False)
 
@@ -589,18 +632,18 @@ class CutSummary(QtCore.QObject):
 
         # Add it back with the new name
         if new_shot_key in self._cut_diffs:
-            for cdiff in self._cut_diffs[new_shot_key]:
-                self._logger.debug("%s %s %s %s" % cdiff.summary())
+            # Only build summaries if they will be logged
+            if self._logger.isEnabledFor(logging.DEBUG):
+                for cdiff in self._cut_diffs[new_shot_key]:
+                    self._logger.debug("%s %s %s %s", *cdiff.summary())
             count = len(self._cut_diffs[new_shot_key])
-            self._logger.debug(
-                "%d Entrie(s) for new shot key %s" % (count, new_shot_key)
-            )
+            self._logger.debug("%d Entrie(s) for new shot key %s", count, new_shot_key)
             # Check if there is some omitted entries (no edit) which we should
             # replace, and choose the best one to replace
             matching_omit_entries = [
                 x for x in self._cut_diffs[new_shot_key] if not x.edit
             ]
-            self._logger.debug("Potential matches: %s" % matching_omit_entries)
+            self._logger.debug("Potential matches: %s", matching_omit_entries)
             if matching_omit_entries:
                 # Loop over candidates and choose the best one
                 best_cdiff = None
@@ -611,8 +654,9 @@ class CutSummary(QtCore.QObject):
                         best_cdiff = cdiff
                         best_score = score
                 self._logger.debug(
-                    "Found omitted entry for new shot key %s: %s"
-                    % (new_shot_key, str(best_cdiff))
+                    "Found omitted entry for new shot key %s: %s",
+                    new_shot_key,
+                    best_cdiff,
                 )
                 # Remove the chosen CutDiff
                 self._cut_diffs[new_shot_key].remove(best_cdiff)
@@ -638,9 +682,7 @@ class CutSummary(QtCore.QObject):
                         self._logger.debug(str(self._cut_diffs[new_shot_key]))
                         raise
             else:
-                self._logger.debug(
-                    "Adding new entry for new Shot key %s" % new_shot_key
-                )
+                self._logger.debug("Adding new entry for new Shot key %s", new_shot_key)
                 # PTR Shot is shared by all entries in this list
                 cdiff = self._cut_diffs[new_shot_key][0]
                 cut_diff.set_sg_shot(cdiff.sg_shot)
@@ -650,6 +692,12 @@ class CutSummary(QtCore.QObject):
                 for cdiff in self._cut_diffs[new_shot_key]:
                     cdiff.set_repeated(True)
         else:
+            # Only retrieve the frame range fields which are used with current
+            # settings
+            if self._cut_diff_settings.use_smart_fields:
+                shot_fields = _SHOT_FIELDS + _SHOT_SMART_RANGE_FIELDS
+            else:
+                shot_fields = _SHOT_FIELDS + _SHOT_RANGE_FIELDS
             existing_linked_shot = self._app.shotgun.find_one(
                 "Shot",
                 [
@@ -657,7 +705,7 @@ class CutSummary(QtCore.QObject):
                     [self._sg_shot_link_field_name, "is", self._sg_entity],
                     ["code", "is", new_name],
                 ],
-                _SHOT_FIELDS,
+                shot_fields,
             )
             if existing_linked_shot:
                 # Link to the first Shot found in the linked Entity whose name matches new_name
@@ -667,12 +715,12 @@ class CutSummary(QtCore.QObject):
                 existing_unlinked_shot = self._app.shotgun.find_one(
                     "Shot",
                     [["project", "is", self._sg_project], ["code", "is", new_name]],
-                    _SHOT_FIELDS,
+                    shot_fields,
                 )
                 if existing_unlinked_shot:
                     cut_diff.set_sg_shot(existing_unlinked_shot)
             self._logger.debug(
-                "Creating single entry for new Shot key %s" % new_shot_key
+                "Creating single entry for new Shot key %s", new_shot_key
             )
             self._cut_diffs[new_shot_key] = ShotCutDiffList(cut_diff)
         cut_diff.check_and_set_changes()
@@ -695,11 +743,9 @@ class CutSummary(QtCore.QObject):
             # This can happen if the diff type changed when a cut_diff is added
             # with repeated shots
             self._logger.debug(
-                "Couldn't retrieve Cut diff type %s in counts (new type : %s)"
-                % (
-                    old_type,
-                    new_type,
-                )
+                "Couldn't retrieve Cut diff type %s in counts (new type : %s)",
+                old_type,
+                new_type,
             )
         else:
             self._counts[old_type] -= 1
@@ -879,6 +925,14 @@ class CutSummary(QtCore.QObject):
         for name, items in self._cut_diffs.items():
             yield (name, items)
 
+    def values(self):
+        """
+        Return the CutDiffs lists for all Shots in this summary
+
+        :returns: A view on CutDiffs lists
+        """
+        return self._cut_diffs.values()
+
     def get_report(self, title, sg_links):
         """
         Build a text report for this summary, highlighting changes
@@ -918,23 +972,39 @@ class CutSummary(QtCore.QObject):
             title,
         )
 
+        # Group CutDiffs per type in a single pass over all of them, rather than
+        # iterating over all of them for each type. Only the earliest entries
+        # are kept for types where repeated Shots are only listed once.
+        earliest_only_types = (
+            _DIFF_TYPES.NEW,
+            _DIFF_TYPES.OMITTED,
+            _DIFF_TYPES.REINSTATED,
+        )
+        edits_per_type = defaultdict(list)
+        for items in self._cut_diffs.values():
+            for item in items:
+                diff_type = item.interpreted_diff_type
+                if diff_type in earliest_only_types and not item.is_earliest():
+                    continue
+                edits_per_type[diff_type].append(item)
+
         cut_changes_details = [
             "%s - %s" % (edit.name, ", ".join(edit.reasons))
             for edit in sorted(
-                self.edits_for_type(_DIFF_TYPES.CUT_CHANGE),
+                edits_per_type[_DIFF_TYPES.CUT_CHANGE],
                 key=lambda x: x.new_cut_order,
             )
         ]
         rescan_details = [
             "%s - %s" % (edit.name, ", ".join(edit.reasons))
             for edit in sorted(
-                self.edits_for_type(_DIFF_TYPES.RESCAN), key=lambda x: x.new_cut_order
+                edits_per_type[_DIFF_TYPES.RESCAN], key=lambda x: x.new_cut_order
             )
         ]
         no_link_details = [
             edit.version_name or str(edit.new_cut_order)
             for edit in sorted(
-                self.edits_for_type(_DIFF_TYPES.NO_LINK), key=lambda x: x.new_cut_order
+                edits_per_type[_DIFF_TYPES.NO_LINK], key=lambda x: x.new_cut_order
             )
         ]
         body = _BODY_REPORT_FORMAT % (
@@ -955,7 +1025,7 @@ class CutSummary(QtCore.QObject):
                 [
                     edit.name
                     for edit in sorted(
-                        self.edits_for_type(_DIFF_TYPES.NEW, just_earliest=True),
+                        edits_per_type[_DIFF_TYPES.NEW],
                         key=lambda x: x.new_cut_order,
                     )
                 ]
@@ -965,7 +1035,7 @@ class CutSummary(QtCore.QObject):
                 [
                     edit.name
                     for edit in sorted(
-                        self.edits_for_type(_DIFF_TYPES.OMITTED, just_earliest=True),
+                        edits_per_type[_DIFF_TYPES.OMITTED],
                         key=lambda x: x.cut_order or -1,
                     )
                 ]
@@ -975,7 +1045,7 @@ class CutSummary(QtCore.QObject):
                 [
                     edit.name
                     for edit in sorted(
-                        self.edits_for_type(_DIFF_TYPES.REINSTATED, just_earliest=True),
+                        edits_per_type[_DIFF_TYPES.REINSTATED],
                         key=lambda x: x.new_cut_order,
                     )
                 ]
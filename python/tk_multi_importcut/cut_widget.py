@@ -53,7 +53,7 @@ class CutCard(CardWidget):
         if self.sg_cut["description"]:
             self.setToolTip(self.sg_cut["description"])
         self.ui.details_label.setVisible(False)
-        self.set_thumbnail(":/tk_multi_importcut/sg_sequence_thumbnail.png")
+        self.set_default_thumbnail(":/tk_multi_importcut/sg_sequence_thumbnail.png")
 
     @property
     def sg_cut(self):
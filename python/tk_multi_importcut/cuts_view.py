@@ -68,34 +68,48 @@ class CutsView(QtCore.QObject):
         """
         return self._grid_layout.count() - 1  # We have a stretcher
 
-    @QtCore.Slot(dict)
-    def new_sg_cut(self, sg_entity):
+    @QtCore.Slot(list)
+    def new_sg_cuts(self, sg_cuts):
         """
-        Called when a new cut card widget needs to be added to the list
+        Called when new cut card widgets need to be added to the list
         of retrieved cuts
 
-        :param sg_entity: A PTR Cut dictionary
-        """
-        i = self.card_count
-        # Remove it
-        spacer = self._grid_layout.takeAt(i)
-        row = i / 2
-        column = i % 2
-        self._logger.debug("Adding %s at %d %d %d" % (sg_entity, i, row, column))
-        widget = CutCard(None, sg_entity)
-        widget.highlight_selected.connect(self.cut_selected)
-        widget.chosen.connect(self.show_cut)
-        self._grid_layout.addWidget(
-            widget,
-            row,
-            column,
-        )
-        self._grid_layout.setRowStretch(row, 0)
-        self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
-        self._grid_layout.setRowStretch(row + 1, 1)
-        self._info_message = (
-            ("%d Cuts" % (i + 1)) if (i + 1) > 1 else ("%d Cut" % (i + 1))
-        )
+        All cards are added with updates disabled on the parent widget, so the
+        layout is only refreshed once.
+
+        :param sg_cuts: A list of PTR Cut dictionaries
+        """
+        if not sg_cuts:
+            return
+        parent_widget = self._grid_layout.parentWidget()
+        if parent_widget:
+            parent_widget.setUpdatesEnabled(False)
+        try:
+            i = self.card_count
+            # Remove the stretcher
+            spacer = self._grid_layout.takeAt(i)
+            for sg_cut in sg_cuts:
+                row = i // 2
+                column = i % 2
+                self._logger.debug("Adding %s at %d %d %d", sg_cut, i, row, column)
+                widget = CutCard(None, sg_cut)
+                widget.highlight_selected.connect(self.cut_selected)
+                widget.chosen.connect(self.show_cut)
+                self._grid_layout.addWidget(
+                    widget,
+                    row,
+                    column,
+                )
+                self._grid_layout.setRowStretch(row, 0)
+                i += 1
+            # Put the stretcher back
+            row = (i - 1) // 2
+            self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
+            self._grid_layout.setRowStretch(row + 1, 1)
+        finally:
+            if parent_widget:
+                parent_widget.setUpdatesEnabled(True)
+        self._info_message = ("%d Cuts" % i) if i > 1 else ("%d Cut" % i)
         self.new_info_message.emit(self._info_message)
 
     @QtCore.Slot(str)
@@ -108,7 +122,7 @@ class CutsView(QtCore.QObject):
         :param u_text: A unicode string to match
         """
         text = sgutils.ensure_str(u_text)
-        self._logger.debug("Searching for %s" % text)
+        self._logger.debug("Searching for %s", text)
         count = self.card_count
         match_count = 0
         if not count:
@@ -149,11 +163,11 @@ class CutsView(QtCore.QObject):
         """
         if self._selected_card_cut:
             self._selected_card_cut.unselect()
-            self._logger.debug("Unselected %s" % self._selected_card_cut)
+            self._logger.debug("Unselected %s", self._selected_card_cut)
         self._selected_card_cut = card
         self._selected_card_cut.select()
         self.selection_changed.emit(card.sg_entity)
-        self._logger.debug("Selected %s" % self._selected_card_cut)
+        self._logger.debug("Selected %s", self._selected_card_cut)
 
     @QtCore.Slot(dict)
     def show_cut(self, sg_cut):
@@ -162,7 +176,7 @@ class CutsView(QtCore.QObject):
 
         :param sg_cut: A Flow Production Tracking Cut dictionary, as retrieved from a find
         """
-        self._logger.info("%s selected for cut summary" % sg_cut["code"])
+        self._logger.info("%s selected for cut summary", sg_cut["code"])
         self.cut_chosen.emit(sg_cut)
 
     @QtCore.Slot(QtGui.QAction)
@@ -218,7 +218,7 @@ class AppDialog(QtGui.QWidget):
         # Load the Entity type we should show in Entities screen from user
         # preferences
         self._preload_entity_type = self._user_settings.get("preload_entity_type")
-        self._logger.debug("Preferred Entity type %s" % self._preload_entity_type)
+        self._logger.debug("Preferred Entity type %s", self._preload_entity_type)
 
         # Keep this thread for UI stuff
         # Handle data and processing in a separate thread
@@ -272,7 +272,7 @@ class AppDialog(QtGui.QWidget):
         self._projects_view.new_info_message.connect(self.display_info_message)
         # When PTR Projects are retrieved by the data manager, let the view know
         # that new cards should be build for them
-        self._processor.new_sg_project.connect(self._projects_view.new_sg_project)
+        self._processor.new_sg_projects.connect(self._projects_view.new_sg_projects)
         self.ui.projects_search_line_edit.search_edited.connect(
             self._projects_view.search
         )
@@ -294,7 +294,7 @@ class AppDialog(QtGui.QWidget):
         self._cuts_view.new_info_message.connect(self.display_info_message)
         # When PTR Cuts are retrieved by the data manager, let the view know
         # that new cards should be build for them
-        self._processor.new_sg_cut.connect(self._cuts_view.new_sg_cut)
+        self._processor.new_sg_cuts.connect(self._cuts_view.new_sg_cuts)
         self.ui.search_line_edit.search_edited.connect(self._cuts_view.search)
         self.ui.search_line_edit.search_changed.connect(self._cuts_view.search)
 
@@ -308,7 +308,7 @@ class AppDialog(QtGui.QWidget):
         self._cut_diffs_view.new_info_message.connect(self.display_info_message)
         # When CutDiffs are retrieved by the data manager, let the view know
         # that new cards should be build for them
-        self._processor.new_cut_diff.connect(self._cut_diffs_view.new_cut_diff)
+        self._processor.cut_diffs_ready.connect(self.retrieve_pending_cut_diffs)
         # and when some should be discarded
         self._processor.delete_cut_diff.connect(self._cut_diffs_view.delete_cut_diff)
 
@@ -421,8 +421,7 @@ class AppDialog(QtGui.QWidget):
             and self._preload_entity_type not in schema_entity_types
         ):
             self._logger.warning(
-                "Resetting invalid Entity type preference %s"
-                % self._preload_entity_type
+                "Resetting invalid Entity type preference %s", self._preload_entity_type
             )
             self._preload_entity_type = None
 
@@ -446,7 +445,7 @@ class AppDialog(QtGui.QWidget):
         # for it
         if count > max_count - 1:
             self._logger.warning(
-                "Sorry, we can only display %d link Entity Types at a time." % max_count
+                "Sorry, we can only display %d link Entity Types at a time.", max_count
             )
             entity_types = entity_types[: max_count - 1]
         # We always want to be able to import against the Project. We want Project
@@ -461,9 +460,7 @@ class AppDialog(QtGui.QWidget):
         # Preselect 1st entry, we will always have at the very least one Project entry
         if self._preload_entity_type is None:
             self._preload_entity_type = entity_types[0][0]
-            self._logger.debug(
-                "Preselecting %s Entity type" % self._preload_entity_type
-            )
+            self._logger.debug("Preselecting %s Entity type", self._preload_entity_type)
 
         for entity_type in entity_types:
             button = self._create_entity_type_button(entity_type[0], entity_type[1])
@@ -487,7 +484,9 @@ class AppDialog(QtGui.QWidget):
         self._entities_views[-1].new_info_message.connect(self.display_info_message)
         # When PTR Entities are retrieved by the data manager, let the view know
         # that new cards should be build for them
-        self._processor.new_sg_entity.connect(self._entities_views[-1].new_sg_entity)
+        self._processor.new_sg_entities.connect(
+            self._entities_views[-1].new_sg_entities
+        )
         self.ui.entities_search_line_edit.search_edited.connect(
             self._entities_views[-1].search
         )
@@ -585,6 +584,16 @@ class AppDialog(QtGui.QWidget):
         if ret == QtGui.QMessageBox.Yes:
             self.goto_step(_DROP_STEP)
 
+    @QtCore.Slot()
+    def retrieve_pending_cut_diffs(self):
+        """
+        Called when the data manager has new CutDiffs available, retrieve them
+        all and let the view build cards for them.
+        """
+        cut_diffs = self._processor.take_pending_cut_diffs()
+        if cut_diffs:
+            self._cut_diffs_view.new_cut_diffs(cut_diffs)
+
     @QtCore.Slot()
     def reset(self):
         """
@@ -635,7 +644,7 @@ class AppDialog(QtGui.QWidget):
                 self.show_projects()
         if next_step == _ENTITY_TYPE_STEP:
             self._logger.debug(
-                "Activating Entity type step for %s" % self._preload_entity_type
+                "Activating Entity type step for %s", self._preload_entity_type
             )
             self.show_entities(self._preload_entity_type)
             # This is a "virtual" step, no UI is shown for it, so we skip it
@@ -677,12 +686,8 @@ class AppDialog(QtGui.QWidget):
             _, ext_2 = os.path.splitext(path)
             if ext_2.lower() == ext.lower():
                 self._logger.error(
-                    "An EDL file and a movie should be dropped, not two %s files."
-                    % (
-                        # Strip leading ".", we can assume it is not empty, otherwise
-                        # it would have been caught in 1st path handling
-                        ext[1:],
-                    )
+                    "An EDL file and a movie should be dropped, not two %s files.",
+                    ext[1:],
                 )
                 return
             self._process_dropped_file(path, ext_2)
@@ -705,8 +710,10 @@ class AppDialog(QtGui.QWidget):
             self.new_movie.emit(path)
         else:
             self._logger.error(
-                "'%s' is not a supported file type. Supported types are %s and movie types: %s."
-                % (os.path.basename(path), _EDL_EXT, str(_VIDEO_EXTS))
+                "'%s' is not a supported file type. Supported types are %s and movie types: %s.",
+                os.path.basename(path),
+                _EDL_EXT,
+                str(_VIDEO_EXTS),
             )
             return False
         return True
@@ -754,7 +761,7 @@ class AppDialog(QtGui.QWidget):
             self.goto_step(_DROP_STEP)
 
         self._logger.debug(
-            "%s EDL is now %s" % (file_name, ["invalid", "valid"][is_valid])
+            "%s EDL is now %s", file_name, ["invalid", "valid"][is_valid]
         )
 
     @QtCore.Slot(str)
@@ -988,7 +995,7 @@ class AppDialog(QtGui.QWidget):
             else:
                 self.ui.create_entity_button.show()
                 self.ui.create_entity_button.setText("New %s" % sg_entity_type_name)
-            self._logger.info("Showing %s(s)" % sg_entity_type_name)
+            self._logger.info("Showing %s(s)", sg_entity_type_name)
             self.ui.entities_search_line_edit.setPlaceholderText(
                 "Search %s" % sg_entity_type_name
             )
@@ -1135,7 +1142,7 @@ class AppDialog(QtGui.QWidget):
                 # on the right screen, so, basically, we don't have anything to do
                 break
         else:
-            self._logger.debug("Creating entities view for %s" % sg_entity_type)
+            self._logger.debug("Creating entities view for %s", sg_entity_type)
             # Create the needed page
             page_i = len(self._entities_views)
             page = entity_type_stacked_widget.widget(page_i)
@@ -1163,7 +1170,7 @@ class AppDialog(QtGui.QWidget):
 
         :param sg_project: A PTR Project dictionary
         """
-        self._logger.info("Using Project %s" % sg_project["name"])
+        self._logger.info("Using Project %s", sg_project["name"])
         self.set_active_project.emit(sg_project)
 
     @QtCore.Slot(dict)
@@ -1182,7 +1189,7 @@ class AppDialog(QtGui.QWidget):
             sgtk.platform.current_bundle().sgtk,
             sg_entity["type"],
         )
-        self._logger.info("Retrieving Cuts for %s %s" % (type_name, name))
+        self._logger.info("Retrieving Cuts for %s %s", type_name, name)
         self.ui.selected_entity_label.setText(
             "%s: <big><b>%s</big></b>"
             % (
@@ -1203,7 +1210,7 @@ class AppDialog(QtGui.QWidget):
         :param sg_cut: A PTR Cut or an empty dictionary
         """
         if sg_cut != {}:
-            self._logger.info("Retrieving Cut information for %s" % sg_cut["code"])
+            self._logger.info("Retrieving Cut information for %s", sg_cut["code"])
         self.get_cut_diff.emit(sg_cut)
 
     @QtCore.Slot()
@@ -1287,7 +1294,7 @@ class AppDialog(QtGui.QWidget):
 
         :param wizard_step: One of our wizard steps
         """
-        self._logger.debug("Settings at step %d" % wizard_step)
+        self._logger.debug("Settings at step %d", wizard_step)
         show_settings_dialog = SettingsDialog(parent=self, wizard_step=wizard_step)
         show_settings_dialog.reset_needed.connect(self.reload_steps)
         show_settings_dialog.show()
@@ -1316,6 +1323,7 @@ class AppDialog(QtGui.QWidget):
             else:
                 raise NotImplementedError("Reloading step %d is not supported" % step)
 
+    @QtCore.Slot(str, dict)
     def create_entity(self, entity_type, fields):
         """
         Creates an Entity of the specified type and
@@ -1372,7 +1380,7 @@ class AppDialog(QtGui.QWidget):
         subject, body = self._processor.summary.get_report(self._processor.title, links)
         # Qt will encode the url for us
         mail_url = QtCore.QUrl("mailto:?subject=%s&body=%s" % (subject, body))
-        self._logger.debug("Opening up %s" % mail_url)
+        self._logger.debug("Opening up %s", mail_url)
         QtGui.QDesktopServices.openUrl(mail_url)
 
     @QtCore.Slot()
@@ -1433,6 +1441,8 @@ class AppDialog(QtGui.QWidget):
                 return
         self._processor.quit()
         self._processor.wait()
+        # Dispatch pending log messages
+        self._bundle_log_handler.flush()
         # Shutdown the download thread pool
         pool = DownloadRunner.get_thread_pool()
         pool.shutdown()
@@ -1452,6 +1462,7 @@ class AppDialog(QtGui.QWidget):
         handler.new_message.connect(self.new_message)
         handler.new_error_with_exc_info.connect(self.display_exception)
         self._logger.addHandler(handler)
+        self._bundle_log_handler = handler
 
         # Copied over from tk-desktop and tk-multi-ingestdelivery
         if sgtk.util.is_macos():
@@ -1557,11 +1568,11 @@ class AppDialog(QtGui.QWidget):
         :param u_path: Full path a to a css file, as a unicode string
         """
         path = sgutils.ensure_str(u_path)
-        self._logger.info("Reloading %s" % path)
+        self._logger.info("Reloading %s", path)
         self._load_css(path)
         # Some code editors rename files on save, so the watcher will
         # stop watching it. Check if the file is watched, re-attach it if not
         if self._css_watcher and path not in self._css_watcher.files():
             self._css_watcher.addPath(path)
-        self._logger.info("%s loaded" % path)
+        self._logger.info("%s loaded", path)
         self.update()
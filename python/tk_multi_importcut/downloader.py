@@ -11,9 +11,17 @@
 # by importing QT from sgtk rather than directly, we ensure that
 # the code will be compatible with both PySide and PyQt.
 
+import hashlib
+import os
+import threading
+import time
+import urllib.parse
+
 from sgtk.platform.qt import QtCore
 import sgtk
 
+from .logger import get_logger
+
 
 class DownloadThreadPool(QtCore.QThreadPool):
     """
@@ -34,12 +42,124 @@ class DownloadThreadPool(QtCore.QThreadPool):
 
         :param runner: A DownloadRunner instance
         """
-        self.abort.connect(runner.abort)
+        self.abort.connect(runner.cancel)
         self.start(runner)
 
 
+# Maximum number of concurrent downloads. Downloads are network bound, so this
+# does not depend on the number of CPUs.
+_MAX_DOWNLOAD_THREADS = 8
+
 # We use a single download thread pool for all downloads
 _download_thread_pool = DownloadThreadPool()
+_download_thread_pool.setMaxThreadCount(_MAX_DOWNLOAD_THREADS)
+
+# Runners for downloads in progress, keyed with their attachment, so a single
+# download is issued when the same attachment is requested multiple times.
+_in_flight_runners = {}
+_in_flight_lock = threading.Lock()
+
+# Folder where thumbnails are cached, set on first use
+_thumbnail_cache_folder = None
+
+# Cached thumbnails not used for this number of seconds are deleted when the
+# cache folder is first set up
+_THUMBNAIL_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def _get_attachment_key(sg_attachment):
+    """
+    Return a key which can be used to identify the given attachment
+
+    PTR thumbnail URLs are signed, with a query string changing each time they
+    are retrieved, so only the URL location is used for them.
+
+    :param sg_attachment: Either a URL or an attachment dictionary
+    :returns: A string
+    """
+    if isinstance(sg_attachment, str):
+        url = urllib.parse.urlsplit(sg_attachment)
+        return "%s://%s%s" % (url.scheme, url.netloc, url.path)
+    return "%s_%s" % (sg_attachment["type"], sg_attachment["id"])
+
+
+def _get_thumbnail_cache_folder():
+    """
+    Return the folder where thumbnails are cached on disk, creating it if
+    needed.
+
+    The folder only depends on the app cache location, so it is only computed
+    and checked once. Thumbnails which were not used recently are deleted at
+    this time, so the cache does not grow forever with stale thumbnails.
+
+    :returns: A full folder path, as a string
+    """
+    global _thumbnail_cache_folder
+    if _thumbnail_cache_folder is None:
+        cache_folder = os.path.join(
+            sgtk.platform.current_bundle().cache_location, "thumbs"
+        )
+        if not os.path.isdir(cache_folder):
+            os.makedirs(cache_folder)
+        else:
+            _clean_thumbnail_cache_folder(cache_folder)
+        _thumbnail_cache_folder = cache_folder
+    return _thumbnail_cache_folder
+
+
+def _clean_thumbnail_cache_folder(cache_folder):
+    """
+    Delete files from the given thumbnails cache folder which were not used
+    for more than _THUMBNAIL_CACHE_MAX_AGE seconds.
+
+    Files which can't be deleted, e.g. because they are in use by another
+    process, are left in place.
+
+    :param cache_folder: Full path to the thumbnails cache folder
+    """
+    oldest = time.time() - _THUMBNAIL_CACHE_MAX_AGE
+    for entry in os.scandir(cache_folder):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < oldest:
+                os.remove(entry.path)
+        except OSError as e:
+            get_logger().debug("Couldn't delete %s: %s", entry.path, e)
+
+
+def get_thumbnail_cache_path(sg_attachment):
+    """
+    Return the path where the given thumbnail is cached on disk.
+
+    Thumbnails are stored in a "thumbs" folder under the app cache location,
+    with a file name derived from the url location, or from the attachment id
+    if an attachment dictionary is given, so they can be reused across sessions.
+
+    :param sg_attachment: Either a URL or an attachment dictionary
+    :returns: A full file path, as a string
+    """
+    key = _get_attachment_key(sg_attachment)
+    return os.path.join(
+        _get_thumbnail_cache_folder(), hashlib.md5(key.encode("utf-8")).hexdigest()
+    )
+
+
+def get_cached_thumbnail(sg_attachment):
+    """
+    Return the path to the cached thumbnail for the given attachment, if it
+    was already downloaded.
+
+    :param sg_attachment: Either a URL or an attachment dictionary
+    :returns: A full file path, as a string, or None
+    """
+    path = get_thumbnail_cache_path(sg_attachment)
+    if os.path.isfile(path) and os.path.getsize(path):
+        # Mark the thumbnail as recently used, so it is kept in the cache
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+    return None
 
 
 class DownloadRunner(QtCore.QRunnable):
@@ -63,11 +183,25 @@ class DownloadRunner(QtCore.QRunnable):
             """
             QtCore.QObject.__init__(self, *args, **kwargs)
             self._aborted = False
+            self._listener_count = 0
 
         @QtCore.Slot()
         def abort(self):
             """
             Allow to signal that the download should be aborted
+
+            If the download is shared between multiple listeners, it is only
+            aborted when all of them asked for it.
+            """
+            self._listener_count -= 1
+            if self._listener_count <= 0:
+                self._aborted = True
+
+        @QtCore.Slot()
+        def cancel(self):
+            """
+            Unconditionally abort the download, e.g. when the thread pool is
+            shutdown
             """
             self._aborted = True
 
@@ -93,6 +227,35 @@ class DownloadRunner(QtCore.QRunnable):
         """
         return _download_thread_pool
 
+    @classmethod
+    def queue_download(cls, sg_attachment, path):
+        """
+        Return a runner downloading the given attachment to the given path,
+        queued on the shared download thread pool.
+
+        If a download is already in progress for the same attachment, and was
+        not aborted, its runner is returned instead of queuing a new one.
+        Callers should connect their slots to the returned runner signals, and
+        connect its abort slot if they want to discard the download.
+
+        :param sg_attachment: Either a URL or an attachment dictionary
+        :param path: Full file path to save the downloaded data
+        :returns: A DownloadRunner instance
+        """
+        key = _get_attachment_key(sg_attachment)
+        with _in_flight_lock:
+            runner = _in_flight_runners.get(key)
+            # A runner aborted by all its listeners won't download anything,
+            # even if it is still queued: replace it with a new one.
+            if runner and not runner._notifier._aborted:
+                runner._notifier._listener_count += 1
+                return runner
+            runner = cls(sg_attachment, path)
+            runner._notifier._listener_count = 1
+            _in_flight_runners[key] = runner
+        runner.queue()
+        return runner
+
     @property
     def file_downloaded(self):
         """
@@ -111,6 +274,15 @@ class DownloadRunner(QtCore.QRunnable):
         """
         return self._notifier.abort
 
+    @property
+    def cancel(self):
+        """
+        Pass through to access the _Notifier slot
+
+        :returns: A QSignal
+        """
+        return self._notifier.cancel
+
     def queue(self):
         """
         Queue this runner on the shared download thread pool
@@ -121,19 +293,43 @@ class DownloadRunner(QtCore.QRunnable):
         """
         Actually run the runner
         """
+        try:
+            self._download()
+        finally:
+            # Allow new requests for the same attachment to be issued. This is
+            # done before emitting the file_downloaded signal so listeners
+            # either receive it, or find the downloaded file on disk.
+            with _in_flight_lock:
+                key = _get_attachment_key(self._sg_attachment)
+                if _in_flight_runners.get(key) is self:
+                    del _in_flight_runners[key]
+        if os.path.exists(self._path):
+            self._notifier.file_downloaded.emit(self._path)
+
+    def _download(self):
+        """
+        Download the attachment, if not aborted.
+
+        Data is downloaded in a temporary file which is renamed once the
+        download is completed, so partially downloaded files are never
+        considered as valid cached files.
+        """
         # Return immediately if the download was aborted
         if self._notifier._aborted:
             return
         sg = sgtk.platform.current_bundle().shotgun
+        # An aborted runner can still be downloading when a new runner is
+        # queued for the same attachment, so each runner has its own part file.
+        part_path = "%s.%x.part" % (self._path, id(self))
         try:
             if isinstance(self._sg_attachment, str):
-                sgtk.util.download_url(sg, self._sg_attachment, self._path)
+                sgtk.util.download_url(sg, self._sg_attachment, part_path)
             else:
-                attachment = sg.download_attachment(
-                    attachment=self._sg_attachment, file_path=self._path
+                sg.download_attachment(
+                    attachment=self._sg_attachment, file_path=part_path
                 )
-            self._notifier.file_downloaded.emit(self._path)
+            os.replace(part_path, self._path)
         except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
             raise
-        finally:
-            pass
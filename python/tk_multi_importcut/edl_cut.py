@@ -9,8 +9,9 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 
 import os
-import re
-from collections import defaultdict
+import string
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import sgtk
 from sgtk.platform.qt import QtCore
@@ -22,7 +23,8 @@ from .entity_line_widget import EntityLineWidget
 # Different wizard style steps in our process
 from .constants import _DROP_STEP, _PROJECT_STEP, _ENTITY_TYPE_STEP
 from .constants import _ENTITY_STEP, _CUT_STEP, _SUMMARY_STEP, _PROGRESS_STEP
-from .constants import _SHOT_FIELDS
+from .constants import _SHOT_FIELDS, _CUT_ITEM_FIELDS
+from .constants import _SHOT_RANGE_FIELDS, _SHOT_SMART_RANGE_FIELDS
 from .constants import _VERSION_EXTS
 
 try:
@@ -56,6 +58,30 @@ _ERROR_DROP_FRAME = (
     "will be added in a future release."
 )
 
+# Characters allowed in Shot names extracted from EDL comments
+_COMMENT_SHOT_NAME_CHARS = string.ascii_letters + string.digits + "_-"
+
+# Maximum number of requests sent in a single PTR batch call
+_BATCH_CHUNK_SIZE = 500
+# Number of PTR records emitted at once when they are streamed to the UI
+_EMIT_CHUNK_SIZE = 50
+
+
+def _same_entity_requests(sg_request, other_sg_request):
+    """
+    Return True if the two given PTR batch requests are for the same existing
+    Entity.
+
+    :param sg_request: A PTR batch request
+    :param other_sg_request: Another PTR batch request
+    :returns: A boolean
+    """
+    return (
+        sg_request.get("entity_id") is not None
+        and sg_request.get("entity_id") == other_sg_request.get("entity_id")
+        and sg_request["entity_type"] == other_sg_request["entity_type"]
+    )
+
 
 def get_sg_entity_name(sg_entity):
     """
@@ -75,6 +101,48 @@ def get_sg_entity_name(sg_entity):
     return entity_name
 
 
+def parse_comment_shot_name(comment):
+    """
+    Extract a Shot name from the given EDL comment
+
+    Comments are expected to look like:
+    * COMMENT : shot-name_001
+    * shot-name_001
+
+    This is equivalent to matching the comment against the
+    r"\*?(\s*COMMENT\s*:)?\s*([a-z0-9A-Z_-]+)$" regular expression, but the
+    comment is scanned directly, without going through the regex engine.
+
+    :param comment: An EDL comment, as a string
+    :returns: A (Shot name, has COMMENT prefix) tuple, or None if no Shot name
+              could be extracted
+    """
+    # Like "$" in a regular expression, allow a single trailing new line
+    if comment.endswith("\n"):
+        comment = comment[:-1]
+    # The Shot name is the trailing run of allowed characters, which rstrip
+    # can find without looping over characters in Python
+    prefix = comment.rstrip(_COMMENT_SHOT_NAME_CHARS)
+    start = len(prefix)
+    if start == len(comment):
+        return None
+    # Check what is before the Shot name is an optional "*" followed by an
+    # optional "COMMENT :" surrounded by white spaces
+    if prefix.startswith("*"):
+        prefix = prefix[1:]
+    prefix = prefix.strip()
+    if not prefix:
+        return comment[start:], False
+    if (
+        len(prefix) > 7
+        and prefix.startswith("COMMENT")
+        and prefix.endswith(":")
+        and not prefix[7:-1].strip()
+    ):
+        return comment[start:], True
+    return None
+
+
 class EdlCut(QtCore.QObject):
     """
     Worker which handles all data, our main data manager.
@@ -96,14 +164,17 @@ class EdlCut(QtCore.QObject):
     # These signals allow the data manager to tell listeners that new data is available.
     # For example, views will create cards for the emitted data when the signals
     # are emitted
-    # Emitted when a new Project is retrieved from PTR
-    new_sg_project = QtCore.Signal(dict)
-    # Emitted when a new Entity is retrieved from PTR
-    new_sg_entity = QtCore.Signal(dict)
-    # Emitted when a new Cut is retrieved from PTR
-    new_sg_cut = QtCore.Signal(dict)
-    # Emitted when a new CutDiff is available
-    new_cut_diff = QtCore.Signal(CutDiff)
+    # Emitted with chunks of Projects retrieved from PTR
+    new_sg_projects = QtCore.Signal(list)
+    # Emitted with all Entities retrieved from PTR
+    new_sg_entities = QtCore.Signal(list)
+    # Emitted with chunks of Cuts retrieved from PTR
+    new_sg_cuts = QtCore.Signal(list)
+    # Emitted when new CutDiffs are available, they are not sent with the signal
+    # but need to be retrieved with take_pending_cut_diffs. It is only emitted
+    # again once listeners retrieved pending CutDiffs, so they are not woken up
+    # for every single CutDiff.
+    cut_diffs_ready = QtCore.Signal()
 
     # Emitted when the data manager is busy doing something. Optionally with an
     # integer describing a known "range" of progress so a progress bar can be shown
@@ -136,11 +207,18 @@ class EdlCut(QtCore.QObject):
         self._edl_file_path = None
         self._mov_file_path = None
         self._edl = None
+        # Number of edits for each reel in the EDL, counted while it is parsed
+        self._reel_counts = defaultdict(int)
         self._sg_cut = None
         self._sg_entity_type = None
         self._sg_shot_link_field_name = None
         self._sg_entity = None
         self._summary = None
+        # CutDiffs added to the summary but not yet retrieved by listeners
+        self._pending_cut_diffs = deque()
+        # Whether listeners were notified about pending CutDiffs and did not
+        # retrieve them yet
+        self._cut_diffs_wake_pending = False
         self._frame_rate = frame_rate
         self._logger = get_logger()
         self._app = sgtk.platform.current_bundle()
@@ -153,9 +231,17 @@ class EdlCut(QtCore.QObject):
         self._project = self._ctx.project
         self._sg_new_cut = None
         self._no_cut_for_entity = False
+        # PTR Statuses, keyed by their code, retrieved when first needed
+        self._sg_statuses = None
         # Retrieve some settings
         self._user_settings = self._app.user_settings
         self._use_smart_fields = self._user_settings.retrieve("use_smart_fields")
+        # Used to run independent PTR queries in parallel. A single executor
+        # is shared by all requests for the lifetime of this worker, threads
+        # are named so they can be identified when debugging.
+        self._executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="importcut-sg-io"
+        )
 
     @property
     def entity_name(self):
@@ -204,25 +290,149 @@ class EdlCut(QtCore.QObject):
         """
         return bool(self._mov_file_path)
 
+    def shutdown(self):
+        """
+        Release resources used by this worker
+        """
+        self._executor.shutdown(wait=True)
+
+    def take_pending_cut_diffs(self):
+        """
+        Return all CutDiffs which were added to the summary since the last call.
+
+        This can be safely called from another thread, typically when the
+        cut_diffs_ready signal is received.
+
+        :returns: A possibly empty list of CutDiff instances.
+        """
+        # Clear the flag before draining: CutDiffs queued after this point
+        # either get drained below, or trigger a new notification.
+        self._cut_diffs_wake_pending = False
+        cut_diffs = []
+        while self._pending_cut_diffs:
+            cut_diffs.append(self._pending_cut_diffs.popleft())
+        return cut_diffs
+
+    @QtCore.Slot(CutDiff)
+    def _queue_cut_diff(self, cut_diff):
+        """
+        Queue the given CutDiff for listeners, notify them unless a notification
+        they did not handle yet is pending.
+
+        :param cut_diff: A CutDiff instance.
+        """
+        self._pending_cut_diffs.append(cut_diff)
+        if not self._cut_diffs_wake_pending:
+            self._cut_diffs_wake_pending = True
+            self.cut_diffs_ready.emit()
+
+    def _sg_find(self, *args, **kwargs):
+        """
+        Run a PTR find with the given parameters.
+
+        This method can be called from any thread, the bundle returning a
+        dedicated PTR connection for each thread.
+
+        :param args: Arbitrary list of parameters to pass to find
+        :param kwargs: Arbitrary dictionary of parameters to pass to find
+        :returns: A list of PTR Entity dictionaries
+        """
+        return self._app.shotgun.find(*args, **kwargs)
+
+    def _sg_batch(self, sg_batch_data):
+        """
+        Run a PTR batch with the given requests.
+
+        This method can be called from any thread, the bundle returning a
+        dedicated PTR connection for each thread.
+
+        :param sg_batch_data: A list of PTR batch requests
+        :returns: A list of results, one for each request
+        """
+        return self._app.shotgun.batch(sg_batch_data)
+
+    def _iter_batch_chunks(self, sg_requests):
+        """
+        Split the given PTR batch requests into chunks.
+
+        Consecutive requests for the same Entity are kept in the same chunk,
+        so they are run in the same PTR transaction.
+
+        :param sg_requests: An iterable of PTR batch requests
+        :yields: Lists of PTR batch requests
+        """
+        sg_batch_data = []
+        for sg_request in sg_requests:
+            # Don't split requests for the same Entity across chunks
+            if len(sg_batch_data) >= _BATCH_CHUNK_SIZE and not _same_entity_requests(
+                sg_request, sg_batch_data[-1]
+            ):
+                yield sg_batch_data
+                sg_batch_data = []
+            sg_batch_data.append(sg_request)
+        if sg_batch_data:
+            yield sg_batch_data
+
+    def _run_batch_chunks(self, sg_requests):
+        """
+        Run the given PTR batch requests in chunks, one chunk after the other,
+        and yield the results of each chunk as soon as it succeeded.
+
+        Each chunk is a separate PTR transaction. A chunk is only sent once
+        the results of the previous one were consumed, so callers can bind
+        them before anything else happens, and no chunk is sent after a
+        failure. Entities created or updated by previous chunks are reported
+        when a chunk fails.
+
+        :param sg_requests: An iterable of PTR batch requests
+        :yields: Lists of results, one for each request in a chunk
+        :raises: The exception raised by the failing PTR batch call
+        """
+        sg_done = []
+        for sg_batch_data in self._iter_batch_chunks(sg_requests):
+            try:
+                res = self._sg_batch(sg_batch_data)
+            except Exception:
+                if sg_done:
+                    self._logger.warning(
+                        "A PTR batch failed after %d request(s) succeeded for: %s",
+                        len(sg_done),
+                        ", ".join(
+                            "%s %s" % (sg_entity["type"], sg_entity["id"])
+                            for sg_entity in sg_done
+                            # Delete requests only return a boolean
+                            if isinstance(sg_entity, dict)
+                        ),
+                    )
+                raise
+            sg_done.extend(res)
+            yield res
+
     def process_edit(self, edit, logger):
         """
         Visitor used when parsing an EDL file
 
-        Extract Shot / Version information from EDL edits and add lambdas
-        to retrieve extracted properties
+        Extract Shot / Version information from EDL edits and store the Version
+        name in an additional _version_name attribute.
+
+        Extracted Shot names, Version names and PTR Versions are read directly
+        from the edit _shot_name, _version_name and _sg_version attributes.
 
         :param edit: Current EditEvent being parsed
         :param logger: Editorial framework logger, not used
         """
+        # Edits are only processed once, processing them again would count
+        # their reel twice
+        if getattr(edit, "_processed", False):
+            return
         # Use our own logger rather than the framework one
         edl.process_edit(edit, self._logger)
         # Check things are right
         # Add empty properties
         edit._sg_version = None
-        # Add some lambda to retrieve properties
-        edit.get_shot_name = lambda: edit._shot_name
-        edit.get_clip_name = lambda: edit._clip_name
-        edit.get_sg_version = lambda: edit._sg_version
+        # Count edits per reel while we parse the EDL, so duplicated reels can
+        # be named without walking the edits again
+        self._reel_counts[edit.reel] += 1
         # In this app, the convention is that clip names hold Version names
         # which is not the case for other apps like tk-multi-importscan
         # where the Version name is set with locators and clip name is used
@@ -232,11 +442,11 @@ class EdlCut(QtCore.QObject):
             # extensions, otherwise use the full clip_name as the Version name.
             clip_name, ext = os.path.splitext(edit._clip_name)
             if ext.lower() in _VERSION_EXTS:
-                edit.get_version_name = lambda: clip_name
+                edit._version_name = clip_name
             else:
-                edit.get_version_name = lambda: edit._clip_name
+                edit._version_name = edit._clip_name
         else:
-            edit.get_version_name = lambda: None
+            edit._version_name = None
         if not edit._shot_name:
             # Shot name was not retrieved from standard approach
             # try to extract it from comments which don't include any
@@ -244,23 +454,20 @@ class EdlCut(QtCore.QObject):
             preferred_match = None
             match = None
             for comment in edit.pure_comments:
-                # Match :
-                # * COMMENT : shot-name_001
-                # * shot-name_001
-                # Most recent patterns are cached by Python so we don't need
-                # to worry about compiling it ourselves for performances consideration
-                m = re.match(r"\*?(\s*COMMENT\s*:)?\s*([a-z0-9A-Z_-]+)$", comment)
-                if m:
-                    if m.group(1):
+                parsed = parse_comment_shot_name(comment)
+                if parsed:
+                    shot_name, has_comment_prefix = parsed
+                    if has_comment_prefix:
                         # Priority is given to matches from line beginning with
                         # * COMMENT
-                        preferred_match = m.group(2)
+                        preferred_match = shot_name
                     else:
-                        match = m.group(2)
+                        match = shot_name
                 if preferred_match:
                     edit._shot_name = preferred_match
                 elif match:
                     edit._shot_name = match
+        edit._processed = True
 
     @QtCore.Slot()
     def reset(self):
@@ -275,6 +482,8 @@ class EdlCut(QtCore.QObject):
         self._sg_shot_link_field_name = None
         self._sg_entity = None
         self._summary = None
+        self._pending_cut_diffs.clear()
+        self._sg_statuses = None
         self._sg_new_cut = None
         if had_something:
             self._logger.info("Session discarded...")
@@ -302,8 +511,8 @@ class EdlCut(QtCore.QObject):
                     # invalidated.
                     self.reset()
                     self._logger.info(
-                        "Failed to reload %s, session discarded..."
-                        % os.path.basename(edl_file_path)
+                        "Failed to reload %s, session discarded...",
+                        os.path.basename(edl_file_path),
                     )
         elif step == _SUMMARY_STEP:
             # Rebuild the Cut summary if we can
@@ -312,7 +521,7 @@ class EdlCut(QtCore.QObject):
         else:
             # Settings changes only affect the two steps above, so do not bother
             # implementing reload for other steps for the time being
-            self._logger.error("Unsupported step %d for reload" % step)
+            self._logger.error("Unsupported step %d for reload", step)
 
     @QtCore.Slot(str, str)
     def process_edl_and_mov(self, edl_file_path, mov_file_path):
@@ -333,7 +542,7 @@ class EdlCut(QtCore.QObject):
         :param movie_file_path: Unicode string, full path to MOV file.
         """
         self._mov_file_path = sgutils.ensure_str(movie_file_path)
-        self._logger.info("Registered %s" % self._mov_file_path)
+        self._logger.info("Registered %s", self._mov_file_path)
         self.valid_movie.emit(os.path.basename(self._mov_file_path))
         # If we have a valid EDL, we can move to next step
         if self.has_valid_edl:
@@ -347,11 +556,12 @@ class EdlCut(QtCore.QObject):
         :param u_edl_file_path: A unicode string, full path to the EDL file.
         """
         edl_file_path = sgutils.ensure_str(u_edl_file_path)
-        self._logger.info("Loading %s..." % (edl_file_path))
+        self._logger.info("Loading %s...", edl_file_path)
         try:
             self._edl_file_path = edl_file_path
+            self._reel_counts = defaultdict(int)
             if self._frame_rate is not None:
-                self._logger.info("Using explicit frame rate %f ..." % self._frame_rate)
+                self._logger.info("Using explicit frame rate %f ...", self._frame_rate)
                 self._edl = edl.EditList(
                     file_path=edl_file_path,
                     visitor=self.process_edit,
@@ -360,19 +570,19 @@ class EdlCut(QtCore.QObject):
             else:
                 # Use default frame rate, retrieved from user settings
                 frame_rate = float(self._user_settings.retrieve("default_frame_rate"))
-                self._logger.info("Using default frame rate %f ..." % frame_rate)
+                self._logger.info("Using default frame rate %f ...", frame_rate)
                 self._edl = edl.EditList(
                     file_path=edl_file_path,
                     visitor=self.process_edit,
                     fps=frame_rate,
                 )
             self._logger.info(
-                "%s loaded, %s edits" % (self._edl.title, len(self._edl.edits))
+                "%s loaded, %s edits", self._edl.title, len(self._edl.edits)
             )
             if self._edl.has_transitions:
                 self.has_transitions.emit()
             if not self._edl.edits:
-                self._logger.warning("Couldn't find any entry in %s" % edl_file_path)
+                self._logger.warning("Couldn't find any entry in %s", edl_file_path)
                 self.valid_edl.emit(os.path.basename(self._edl_file_path), False)
                 return
             # Can go to next step
@@ -402,7 +612,7 @@ class EdlCut(QtCore.QObject):
         self._edl_file_path = None
         self._logger.exception(error)
         # Report a small error message which can be displayed in the UI
-        self._logger.error("Unable to read %s" % edl_file)
+        self._logger.error("Unable to read %s", edl_file)
 
     def _bind_versions(self):
         """
@@ -412,16 +622,13 @@ class EdlCut(QtCore.QObject):
         if not self._edl:
             raise RuntimeError("No EDL file is currently loaded")
 
-        self._logger.info("Binding edits to %s's Versions" % self._project["name"])
-        # Reset everything
-        for edit in self._edl.edits:
-            edit._sg_version = None
-
-        # Consolidate loaded EDL data
+        self._logger.info("Binding edits to %s's Versions", self._project["name"])
+        # Reset everything and consolidate loaded EDL data in a single pass
         # Build a dictionary using versions names as keys
         versions_names = defaultdict(list)
         for edit in self._edl.edits:
-            v_name = edit.get_version_name()
+            edit._sg_version = None
+            v_name = edit._version_name
             if v_name:
                 # PTR find method is case insensitive, don't have to worry
                 # about upper / lower case names match
@@ -438,10 +645,10 @@ class EdlCut(QtCore.QObject):
                 ],
                 ["code", "entity", "entity.Shot.code", "image"],
             )
-            # And update edits with the PTR versions retrieved
+            # And update edits with the PTR versions retrieved. Don't index the
+            # defaultdict directly, it would add an entry for unexpected codes.
             for sg_version in sg_versions:
-                edits = versions_names[sg_version["code"].lower()]
-                for edit in edits:
+                for edit in versions_names.get(sg_version["code"].lower(), []):
                     edit._sg_version = sg_version
                     # If we have a linked Version, its linked Shot takes precedence
                     # over Shot names retrieved from locators, comments, etc...
@@ -460,7 +667,7 @@ class EdlCut(QtCore.QObject):
         self._project = sg_project
         self._bind_versions()
         self.step_done.emit(_PROJECT_STEP)
-        self._logger.info("Project %s activated..." % sg_project["name"])
+        self._logger.info("Project %s activated...", sg_project["name"])
 
     def _get_sg_statuses(self):
         """
@@ -469,9 +676,13 @@ class EdlCut(QtCore.QObject):
         A '_bg_hex_color' additional key with the bg color converted to hexadecimal
         is added to the values retrieved from Flow Production Tracking
 
+        Statuses are only retrieved once, until this worker is reset.
+
         :returns: A dictionary where keys are Statuses code and values Statuses
                   dictionaries
         """
+        if self._sg_statuses is not None:
+            return self._sg_statuses
         sg_statuses = self._sg.find("Status", [], ["code", "name", "icon", "bg_color"])
         status_dict = {}
         for sg_status in sg_statuses:
@@ -479,6 +690,7 @@ class EdlCut(QtCore.QObject):
                 r, g, b = sg_status["bg_color"].split(",")
                 sg_status["_bg_hex_color"] = "#%02x%02x%02x" % (int(r), int(g), int(b))
             status_dict[sg_status["code"]] = sg_status
+        self._sg_statuses = status_dict
         return status_dict
 
     @QtCore.Slot(str)
@@ -494,7 +706,7 @@ class EdlCut(QtCore.QObject):
         # Retrieve display names and colors for statuses
         status_dict = self._get_sg_statuses()
         self._logger.info(
-            "Retrieving %ss for project %s..." % (entity_type, self._project["name"])
+            "Retrieving %ss for project %s...", entity_type, self._project["name"]
         )
         self.got_busy.emit(None)
         try:
@@ -512,7 +724,7 @@ class EdlCut(QtCore.QObject):
                 and field["data_type"]["value"] == "entity"
                 and self._sg_entity_type in field["properties"]["valid_types"]["value"]
             ):
-                self._logger.debug("Using preferred Shot field %s" % field_name)
+                self._logger.debug("Using preferred Shot field %s", field_name)
                 self._sg_shot_link_field_name = field_name
             else:
                 # General lookup
@@ -527,13 +739,14 @@ class EdlCut(QtCore.QObject):
                             break
             if not self._sg_shot_link_field_name:
                 self._logger.warning(
-                    "Couldn't retrieve a field accepting %s on shots"
-                    % (self._sg_entity_type,)
+                    "Couldn't retrieve a field accepting %s on shots",
+                    self._sg_entity_type,
                 )
             else:
                 self._logger.info(
-                    "Will use field %s to link %s to shots"
-                    % (self._sg_shot_link_field_name, self._sg_entity_type)
+                    "Will use field %s to link %s to shots",
+                    self._sg_shot_link_field_name,
+                    self._sg_entity_type,
                 )
             if entity_type == "Project":
                 sg_entities = self._sg.find(
@@ -573,8 +786,9 @@ class EdlCut(QtCore.QObject):
                     sg_entity["_display_status"] = {
                         "name": status.title(),
                     }
-                self.new_sg_entity.emit(sg_entity)
-            self._logger.info("Retrieved %d %s." % (len(sg_entities), entity_type))
+            # Emit all of them at once, so listeners can process them in one go
+            self.new_sg_entities.emit(sg_entities)
+            self._logger.info("Retrieved %d %s.", len(sg_entities), entity_type)
             self.step_done.emit(_ENTITY_TYPE_STEP)
         except Exception as e:
             self._logger.exception(str(e))
@@ -597,14 +811,17 @@ class EdlCut(QtCore.QObject):
                 fields,
                 order=order,
             )
-            self._logger.info("Retrieved %d Projects." % len(sg_projects))
+            self._logger.info("Retrieved %d Projects.", len(sg_projects))
             for sg_project in sg_projects:
                 status = sg_project["sg_status"] or ""
                 # Add a custom field with the status ready to be displayed
                 sg_project["_display_status"] = {
                     "name": status.title(),
                 }
-                self.new_sg_project.emit(sg_project)
+            # Emit them in chunks, so the UI can start showing them without
+            # having to process a signal for each of them
+            for i in range(0, len(sg_projects), _EMIT_CHUNK_SIZE):
+                self.new_sg_projects.emit(sg_projects[i : i + _EMIT_CHUNK_SIZE])
         except Exception as e:
             self._logger.exception(str(e))
         finally:
@@ -620,7 +837,7 @@ class EdlCut(QtCore.QObject):
         self._sg_entity = sg_entity
         # Retrieve display names and colors for statuses
         status_dict = self._get_sg_statuses()
-        self._logger.info("Retrieving Cuts for %s ..." % self.entity_name)
+        self._logger.info("Retrieving Cuts for %s ...", self.entity_name)
         self.got_busy.emit(None)
         try:
             sg_cuts = self._sg.find(
@@ -632,9 +849,6 @@ class EdlCut(QtCore.QObject):
                     "sg_status_list",
                     "image",
                     "description",
-                    "created_by",
-                    "updated_by",
-                    "updated_at",
                     "created_at",
                     "revision_number",
                 ],
@@ -653,8 +867,11 @@ class EdlCut(QtCore.QObject):
                     sg_cut["_display_status"] = status_dict[sg_cut["sg_status_list"]]
                 else:
                     sg_cut["_display_status"] = sg_cut["sg_status_list"]
-                self.new_sg_cut.emit(sg_cut)
-            self._logger.info("Retrieved %d Cuts." % len(sg_cuts))
+            # Emit them in chunks, so the UI can start showing them without
+            # having to process a signal for each of them
+            for i in range(0, len(sg_cuts), _EMIT_CHUNK_SIZE):
+                self.new_sg_cuts.emit(sg_cuts[i : i + _EMIT_CHUNK_SIZE])
+            self._logger.info("Retrieved %d Cuts.", len(sg_cuts))
             self.step_done.emit(_ENTITY_STEP)
         except Exception as e:
             self._logger.exception(str(e))
@@ -685,9 +902,12 @@ class EdlCut(QtCore.QObject):
                        Flow Production Tracking, or an empty dictionary. Used to
                        compare new Cut information with the last Cut.
         """
-        self._logger.info("Retrieving Cut summary for %s" % self.entity_name)
+        self._logger.info("Retrieving Cut summary for %s", self.entity_name)
         self.got_busy.emit(None)
         self._sg_cut = sg_cut
+        # This setting affects the Cut summary, which is rebuilt when it is
+        # changed: refresh it.
+        self._use_smart_fields = self._user_settings.retrieve("use_smart_fields")
 
         # We've got an opportunity here to set the tc start/end values on
         # CutSummary, so lets do that so we can set it on the Cut record too
@@ -704,59 +924,64 @@ class EdlCut(QtCore.QObject):
             tc_end,
         )
         # Connect CutSummary signals to ours as pass through, so any listener
-        # on our signals will receive signals emitted by the CutSummary
-        self._summary.new_cut_diff.connect(self.new_cut_diff)
-        self._summary.delete_cut_diff.connect(self.delete_cut_diff)
-        self._summary.totals_changed.connect(self.totals_changed)
+        # on our signals will receive signals emitted by the CutSummary.
+        # The CutSummary lives in our thread and emits its signals from it, so
+        # they are re-emitted directly, without going through the event loop.
+        # New CutDiffs are queued and pulled by listeners.
+        self._pending_cut_diffs.clear()
+        self._summary.new_cut_diff.connect(
+            self._queue_cut_diff, QtCore.Qt.DirectConnection
+        )
+        self._summary.delete_cut_diff.connect(
+            self.delete_cut_diff, QtCore.Qt.DirectConnection
+        )
+        self._summary.totals_changed.connect(
+            self.totals_changed, QtCore.Qt.DirectConnection
+        )
         try:
-            # Fields that we need to retrieve on Shots
-            shot_fields = _SHOT_FIELDS
+            # Fields that we need to retrieve on Shots, only retrieve the frame
+            # range fields which are used with current settings. Don't modify
+            # the shared lists in place.
+            if self._use_smart_fields:
+                shot_fields = _SHOT_FIELDS + _SHOT_SMART_RANGE_FIELDS
+            else:
+                shot_fields = _SHOT_FIELDS + _SHOT_RANGE_FIELDS
             if self._sg_shot_link_field_name:
                 shot_fields.append(self._sg_shot_link_field_name)
-            sg_cut_items = []
-            sg_shots_dict = {}
+            # Retrieve Shot names from the edits once, they are used in multiple
+            # places below
+            shot_names = [edit._shot_name for edit in self._edl.edits]
+            # Lower cased Shot names from the edits
+            edit_shot_names = set(x.lower() for x in shot_names if x)
+            # CutItems and Shots matching edits can be retrieved in parallel
+            sg_cut_items_future = None
             if sg_cut:
                 # Retrieve all CutItems linked to that Cut
-                sg_cut_items = self._sg.find(
+                sg_cut_items_future = self._executor.submit(
+                    self._sg_find,
                     "CutItem",
                     [["cut", "is", sg_cut]],
+                    _CUT_ITEM_FIELDS,
+                )
+            sg_edit_shots_future = None
+            if edit_shot_names:
+                sg_edit_shots_future = self._executor.submit(
+                    self._sg_find,
+                    "Shot",
                     [
-                        "cut",
-                        "timecode_cut_item_in_text",
-                        "timecode_cut_item_out_text",
-                        "cut_order",
-                        "cut_item_in",
-                        "cut_item_out",
-                        "shot",
-                        "cut_duration",
-                        "cut_item_duration",
-                        "cut.Cut.fps",
-                        "version",
-                        "version.Version.code",
-                        "version.Version.entity",
-                        "version.Version.image",
+                        ["project", "is", self._project],
+                        ["code", "in", list(edit_shot_names)],
                     ],
+                    shot_fields,
                 )
-                # Consolidate versions retrieved from CutItems
-                # Because of a bug in the Flow Production Tracking API, we can't use
-                # two levels of redirection, with "sg_version.Version.entity.Shot.code",
-                # to retrieve the Shot linked to the Version, a CRUD
-                # error will happen if one of the CutItem does not have Version linked
-                sg_cut_item_version_ids = [
-                    x["version"]["id"] for x in sg_cut_items if x["version"]
-                ]
-                sg_cut_item_versions = {}
-                if sg_cut_item_version_ids:
-                    sg_cut_item_versions_list = self._sg.find(
-                        "Version",
-                        [["id", "in", sg_cut_item_version_ids]],
-                        ["entity", "entity.Shot.code"],
-                    )
-                    # Index results with their PTR id
-                    for item_version in sg_cut_item_versions_list:
-                        sg_cut_item_versions[item_version["id"]] = item_version
-                # We match fields that we would have retrieved with an sg.find("Version", ...)
-                # And collect a list of Shots while we loop over CutItems.
+            sg_cut_items = []
+            # CutItems indexed by their linked Shot, so CutItems for a given
+            # Shot can be retrieved without scanning all of them
+            sg_cut_items_by_shot = defaultdict(list)
+            sg_shots = []
+            if sg_cut_items_future:
+                sg_cut_items = sg_cut_items_future.result()
+                # Check CutItems and collect a list of Shots while we loop over them.
                 sg_known_shot_ids = set()
                 for sg_cut_item in sg_cut_items:
                     reasons = []
@@ -769,126 +994,137 @@ class EdlCut(QtCore.QObject):
                         raise ValueError(
                             _ERROR_BAD_CUT % (cut_name, " and ".join(reasons), cut_name)
                         )
-                    if sg_cut_item["shot"] and sg_cut_item["shot"]["type"] == "Shot":
-                        sg_known_shot_ids.add(sg_cut_item["shot"]["id"])
-                    if sg_cut_item["version"]:
-                        sg_cut_item["version"]["code"] = sg_cut_item[
-                            "version.Version.code"
-                        ]
-                        sg_cut_item["version"]["entity"] = sg_cut_item[
-                            "version.Version.entity"
-                        ]
-                        sg_cut_item["version"]["image"] = sg_cut_item[
-                            "version.Version.image"
-                        ]
-                        item_version = sg_cut_item_versions.get(
-                            sg_cut_item["version"]["id"]
-                        )
-                        if item_version:
-                            sg_cut_item["version"]["entity.Shot.code"] = item_version[
-                                "entity.Shot.code"
-                            ]
-                        else:
-                            sg_cut_item["version"]["entity.Shot.code"] = None
-                # Retrieve details for Shots linked to the CutItems
-                if sg_known_shot_ids:
-                    sg_shots = self._sg.find(
-                        "Shot", [["id", "in", list(sg_known_shot_ids)]], shot_fields
+                    if sg_cut_item["shot"]:
+                        sg_cut_items_by_shot[
+                            (sg_cut_item["shot"]["type"], sg_cut_item["shot"]["id"])
+                        ].append(sg_cut_item)
+                        if sg_cut_item["shot"]["type"] == "Shot":
+                            sg_known_shot_ids.add(sg_cut_item["shot"]["id"])
+                # Consolidate versions retrieved from CutItems
+                # Because of a bug in the Flow Production Tracking API, we can't use
+                # two levels of redirection, with "version.Version.entity.Shot.code",
+                # to retrieve the Shot linked to the Version, a CRUD
+                # error will happen if one of the CutItem does not have Version linked,
+                # or if the Version is not linked to a Shot.
+                sg_cut_item_version_ids = [
+                    x["version"]["id"] for x in sg_cut_items if x["version"]
+                ]
+                sg_cut_item_versions_future = None
+                if sg_cut_item_version_ids:
+                    sg_cut_item_versions_future = self._executor.submit(
+                        self._sg_find,
+                        "Version",
+                        [["id", "in", sg_cut_item_version_ids]],
+                        ["entity.Shot.code"],
                     )
-                    # Build a dictionary where Shot names are the keys, use the Shot id
-                    # if the name is not set
-                    sg_shots_dict = dict(
-                        ((x["code"] or str(x["id"])).lower(), x) for x in sg_shots
+                # Retrieve details for Shots linked to the CutItems, in parallel,
+                # skipping the ones we already retrieved from the edits
+                if sg_edit_shots_future:
+                    sg_shots = sg_edit_shots_future.result()
+                    sg_edit_shots_future = None
+                sg_missing_shot_ids = sg_known_shot_ids.difference(
+                    x["id"] for x in sg_shots
+                )
+                if sg_missing_shot_ids:
+                    sg_shots.extend(
+                        self._sg_find(
+                            "Shot",
+                            [["id", "in", list(sg_missing_shot_ids)]],
+                            shot_fields,
+                        )
                     )
-            # Retrieve additional Shots from the edits if needed
-            more_shot_names = set()
-            for edit in self._edl.edits:
-                shot_name = edit.get_shot_name()
-                if shot_name:
-                    lower_shot_name = shot_name.lower()
-                    if lower_shot_name not in sg_shots_dict:
-                        more_shot_names.add(shot_name.lower())
-            if more_shot_names:
-                sg_more_shots = self._sg.find(
-                    "Shot",
-                    [
-                        ["project", "is", self._project],
-                        ["code", "in", list(more_shot_names)],
-                    ],
-                    shot_fields,
+                # Index Versions with their PTR id
+                sg_cut_item_versions = {}
+                if sg_cut_item_versions_future:
+                    sg_cut_item_versions = {
+                        x["id"]: x for x in sg_cut_item_versions_future.result()
+                    }
+                # We match fields that we would have retrieved with an sg.find("Version", ...)
+                for sg_cut_item in sg_cut_items:
+                    sg_version = sg_cut_item["version"]
+                    if sg_version:
+                        item_version = sg_cut_item_versions.get(sg_version["id"])
+                        sg_version.update(
+                            {
+                                "code": sg_cut_item["version.Version.code"],
+                                "entity": sg_cut_item["version.Version.entity"],
+                                "image": sg_cut_item["version.Version.image"],
+                                "entity.Shot.code": (
+                                    item_version["entity.Shot.code"]
+                                    if item_version
+                                    else None
+                                ),
+                            }
+                        )
+                # Build a dictionary where Shot names are the keys, use the Shot id
+                # if the name is not set. Shots linked to CutItems take precedence
+                # over Shots with the same name only matching edits.
+                sg_shots_dict = dict(
+                    ((x["code"] or str(x["id"])).lower(), x)
+                    for x in sg_shots
+                    if x["id"] in sg_known_shot_ids
                 )
-                for sg_shot in sg_more_shots:
+            else:
+                sg_shots_dict = {}
+            # Add Shots matching edits
+            if sg_edit_shots_future:
+                sg_shots = sg_edit_shots_future.result()
+            for sg_shot in sg_shots:
+                if sg_shot["code"]:
                     shot_name = sg_shot["code"].lower()
-                    sg_shots_dict[shot_name] = sg_shot
-            # Duplicate the list of shots, allowing us to know easily which ones are not part
-            # of this edit by removing entries when we use them. We only need a shallow copy
-            # here
-            leftover_shots = [x for x in sg_shots_dict.values()]
+                    if shot_name not in sg_shots_dict:
+                        sg_shots_dict[shot_name] = sg_shot
+            # Index Shots with their id, to match left over CutItems
+            sg_shots_by_id = dict((x["id"], x) for x in sg_shots_dict.values())
+            # Keep track of the Shots we use, allowing us to know easily which ones
+            # are not part of this edit.
+            used_shot_ids = set()
             # Record the list of Shots for completion purpose, we don't use the keys as
             # they are lower cased, but the original Shot names
             EntityLineWidget.set_known_list(
                 x["code"] for x in sg_shots_dict.values() if x["code"]
             )
 
-            # Building a little dictionary for use in naming reels /
-            # CutItem Name / code (whatever you want to call it).
-            # Basically we add a 3 padded number to the end of any
-            # reel that has a name which is duplicated, so we need an
-            # iteration key and a dup key
-            reel_names = {}
-            for edit in self._edl.edits:
-                if reel_names.get(edit.reel):
-                    reel_names[edit.reel]["dup"] = True
-                else:
-                    reel_names[edit.reel] = {}
-                    reel_names[edit.reel]["dup"] = False
-                reel_names[edit.reel]["iter"] = 1
-
-            for edit in self._edl.edits:
-                if reel_names[edit.reel]["dup"] is True:
-                    edit.reel_name = "%s%03d" % (
-                        edit.reel,
-                        reel_names[edit.reel]["iter"],
-                    )
-                    # Increment the iter counter for next one
-                    reel_names[edit.reel]["iter"] += 1
+            # Naming reels / CutItem Name / code (whatever you want to call it).
+            # Basically we add a 3 padded number to the end of any reel that
+            # has a name which is duplicated, so we need an iteration counter
+            # for each of them. Duplicated reels were counted when the EDL was
+            # parsed.
+            reel_iters = defaultdict(int)
+            # CutDiffs are added to the summary all at once, after all edits and
+            # CutItems were matched: collect (Shot name, PTR Shot, edit,
+            # PTR CutItem) entries for them.
+            entries = []
+            # PTR Shots used for each Shot name already seen, keyed by lower
+            # case Shot names.
+            seen_shots = {}
+            for edit, shot_name in zip(self._edl.edits, shot_names):
+                if self._reel_counts[edit.reel] > 1:
+                    # Increment the iter counter for this one
+                    reel_iters[edit.reel] += 1
+                    edit.reel_name = "%s%03d" % (edit.reel, reel_iters[edit.reel])
                 else:
                     edit.reel_name = edit.reel
 
-                shot_name = edit.get_shot_name()
                 if not shot_name:
                     # If we don't have a Shot name, we can't match anything
-                    self._summary.add_cut_diff(
-                        None, sg_shot=None, edit=edit, sg_cut_item=None
-                    )
+                    entries.append((None, None, edit, None))
                 else:
                     lower_shot_name = shot_name.lower()
-                    self._logger.debug(
-                        "Matching %s for %s"
-                        % (
-                            lower_shot_name,
-                            str(edit),
-                        )
-                    )
-                    existing = self._summary.diffs_for_shot(shot_name)
+                    # Let the logger format messages in this loop, only if they
+                    # are actually emitted
+                    self._logger.debug("Matching %s for %s", lower_shot_name, edit)
                     # Is it a duplicate ?
-                    if existing:
-                        self._logger.debug(
-                            "Found duplicated Shot, Shot %s (%s)"
-                            % (shot_name, existing)
-                        )
+                    if lower_shot_name in seen_shots:
+                        self._logger.debug("Found duplicated Shot %s", shot_name)
+                        existing_shot = seen_shots[lower_shot_name]
                         sg_cut_item = self.sg_cut_item_for_shot(
-                            sg_cut_items,
-                            existing[0].sg_shot,
-                            edit.get_sg_version(),
+                            sg_cut_items_by_shot,
+                            existing_shot,
+                            edit._sg_version,
                             edit,
                         )
-                        self._summary.add_cut_diff(
-                            shot_name,
-                            sg_shot=existing[0].sg_shot,
-                            edit=edit,
-                            sg_cut_item=sg_cut_item,
-                        )
+                        entries.append((shot_name, existing_shot, edit, sg_cut_item))
                     else:
                         matching_cut_item = None
                         # Do we have a matching Shot in PTR ?
@@ -896,27 +1132,31 @@ class EdlCut(QtCore.QObject):
                         if matching_shot:
                             # yes we do
                             self._logger.debug(
-                                "Found matching existing Shot %s" % shot_name
+                                "Found matching existing Shot %s", shot_name
                             )
-                            # Remove this entry from the leftovers
-                            if matching_shot in leftover_shots:
-                                leftover_shots.remove(matching_shot)
+                            # Flag this Shot as used
+                            used_shot_ids.add(matching_shot["id"])
                             matching_cut_item = self.sg_cut_item_for_shot(
-                                sg_cut_items,
+                                sg_cut_items_by_shot,
                                 matching_shot,
-                                edit.get_sg_version(),
+                                edit._sg_version,
                                 edit,
                             )
-                        self._summary.add_cut_diff(
-                            shot_name,
-                            sg_shot=matching_shot,
-                            edit=edit,
-                            sg_cut_item=matching_cut_item,
+                        seen_shots[lower_shot_name] = matching_shot
+                        entries.append(
+                            (shot_name, matching_shot, edit, matching_cut_item)
                         )
 
             # Process CutItems left over, they are all the CutItems which were
-            # not matched to an edit event in the loaded EDL.
+            # not matched to an edit event in the loaded EDL. Matched CutItems
+            # were removed from the index, loop over the original list to keep
+            # the same order.
+            leftover_cut_item_ids = set(
+                x["id"] for items in sg_cut_items_by_shot.values() for x in items
+            )
             for sg_cut_item in sg_cut_items:
+                if sg_cut_item["id"] not in leftover_cut_item_ids:
+                    continue
                 # If not compliant to what we expect, just ignore it
                 if (
                     sg_cut_item["shot"]
@@ -924,46 +1164,41 @@ class EdlCut(QtCore.QObject):
                     and sg_cut_item["shot"]["type"] == "Shot"
                 ):
                     shot_name = "No Link"
-                    matching_shot = None
-                    for sg_shot in sg_shots_dict.values():
-                        if sg_shot["id"] == sg_cut_item["shot"]["id"]:
-                            # We found a matching Shot
-                            self._logger.debug(
-                                "Found matching existing Shot %s" % shot_name
-                            )
-                            shot_name = sg_shot["code"]
-                            matching_shot = sg_shot
-                            # Remove this entry from the list
-                            if sg_shot in leftover_shots:
-                                leftover_shots.remove(sg_shot)
-                            break
-                    self._summary.add_cut_diff(
-                        shot_name,
-                        sg_shot=matching_shot,
-                        edit=None,
-                        sg_cut_item=sg_cut_item,
-                    )
-
+                    matching_shot = sg_shots_by_id.get(sg_cut_item["shot"]["id"])
+                    if matching_shot:
+                        # We found a matching Shot
+                        shot_name = matching_shot["code"]
+                        self._logger.debug("Found matching existing Shot %s", shot_name)
+                        # Flag this Shot as used
+                        used_shot_ids.add(matching_shot["id"])
+                    entries.append((shot_name, matching_shot, None, sg_cut_item))
+            self._summary.add_cut_diffs(entries)
+
+            leftover_shots = [
+                x for x in sg_shots_by_id.values() if x["id"] not in used_shot_ids
+            ]
             if leftover_shots:
                 # This shouldn't happen, as our list of Shots comes from edits
                 # and CutItems, and we should have processed all of them. Issue
                 # a warning if it is the case.
-                self._logger.warning("Found %s left over Shots..." % leftover_shots)
+                self._logger.warning("Found %s left over Shots...", leftover_shots)
 
-            self._logger.info("Retrieved %d Cut differences." % len(self._summary))
+            self._logger.info("Retrieved %d Cut differences.", len(self._summary))
             self.step_done.emit(_CUT_STEP)
         except Exception as e:
             self._logger.exception(str(e))
         finally:
             self.got_idle.emit()
 
-    def sg_cut_item_for_shot(self, sg_cut_items, sg_shot, sg_version=None, edit=None):
+    def sg_cut_item_for_shot(
+        self, sg_cut_items_by_shot, sg_shot, sg_version=None, edit=None
+    ):
         """
-        Return a CutItem for the given Shot from the given CutItems list retrieved
+        Return a CutItem for the given Shot from the given CutItems retrieved
         from Flow Production Tracking
 
-        The sg_cut_items list is modified inside this method, entries being removed as
-        they are chosen.
+        The sg_cut_items_by_shot dictionary is modified inside this method, entries
+        being removed as they are chosen.
 
         Best matching CutItem is returned, a score is computed for each entry
         from:
@@ -973,72 +1208,65 @@ class EdlCut(QtCore.QObject):
         - Is the tc in the same?
         - Is the tc out the same?
 
-        :param sg_cut_items: A list of CutItem instances to consider
+        :param sg_cut_items_by_shot: A dictionary where keys are (type, id) tuples
+                                     for linked Shots and values lists of PTR
+                                     CutItem dictionaries to consider
         :param sg_shot: A PTR Shot dictionary
         :param sg_version: A PTR Version dictionary
         :param edit: An EditEvent instance or None
         :returns: A PTR CutItem dictionary, or None
         """
 
+        if not sg_shot:
+            return None
+        # Only consider CutItems linked to the given Shot
+        sg_cut_items = sg_cut_items_by_shot.get((sg_shot["type"], sg_shot["id"]))
+        if not sg_cut_items:
+            return None
         potential_matches = []
         for sg_cut_item in sg_cut_items:
-            # Is it linked to the given Shot ?
-            if (
-                sg_cut_item["shot"]
-                and sg_shot
-                and sg_cut_item["shot"]["id"] == sg_shot["id"]
-                and sg_cut_item["shot"]["type"] == sg_shot["type"]
-            ):
-                # We can have multiple CutItems for the same Shot
-                # use the linked Version to pick the right one, if
-                # available
-                if not sg_version:
-                    # No particular Version to match, score is based on
-                    # on differences between Cut order, tc in and out
-                    # give score a bonus as we don't have an explicit mismatch
+            # We can have multiple CutItems for the same Shot
+            # use the linked Version to pick the right one, if
+            # available
+            if not sg_version:
+                # No particular Version to match, score is based on
+                # on differences between Cut order, tc in and out
+                # give score a bonus as we don't have an explicit mismatch
+                potential_matches.append(
+                    (sg_cut_item, 100 + self._get_cut_item_score(sg_cut_item, edit))
+                )
+            elif sg_cut_item["version"]:
+                if sg_version["id"] == sg_cut_item["version"]["id"]:
+                    # Give a bonus to score as we matched the right
+                    # Version
                     potential_matches.append(
-                        (sg_cut_item, 100 + self._get_cut_item_score(sg_cut_item, edit))
-                    )
-                elif sg_cut_item["version"]:
-                    if sg_version["id"] == sg_cut_item["version"]["id"]:
-                        # Give a bonus to score as we matched the right
-                        # Version
-                        potential_matches.append(
-                            (
-                                sg_cut_item,
-                                1000 + self._get_cut_item_score(sg_cut_item, edit),
-                            )
-                        )
-                    else:
-                        # Version mismatch, don't give any bonus
-                        potential_matches.append(
-                            (sg_cut_item, self._get_cut_item_score(sg_cut_item, edit))
+                        (
+                            sg_cut_item,
+                            1000 + self._get_cut_item_score(sg_cut_item, edit),
                         )
+                    )
                 else:
-                    # Will keep looking around but we keep a reference to
-                    # CutItem since it is linked to the same Shot
-                    # give score a little bonus as we didn't have any explicit
-                    # mismatch
+                    # Version mismatch, don't give any bonus
                     potential_matches.append(
-                        (sg_cut_item, 100 + self._get_cut_item_score(sg_cut_item, edit))
+                        (sg_cut_item, self._get_cut_item_score(sg_cut_item, edit))
                     )
             else:
-                self._logger.debug("Rejecting %s for %s" % (sg_cut_item, edit))
+                # Will keep looking around but we keep a reference to
+                # CutItem since it is linked to the same Shot
+                # give score a little bonus as we didn't have any explicit
+                # mismatch
+                potential_matches.append(
+                    (sg_cut_item, 100 + self._get_cut_item_score(sg_cut_item, edit))
+                )
         if potential_matches:
             potential_matches.sort(key=lambda x: x[1], reverse=True)
             for pm in potential_matches:
-                self._logger.debug(
-                    "Potential matches %s score %s"
-                    % (
-                        pm[0],
-                        pm[1],
-                    )
-                )
+                self._logger.debug("Potential matches %s score %s", pm[0], pm[1])
             # Return just the CutItem, not including the score
             best = potential_matches[0][0]
             # Prevent this one to be matched multiple times
             sg_cut_items.remove(best)
-            self._logger.debug("Best is %s for %s" % (best, edit))
+            self._logger.debug("Best is %s for %s", best, edit)
             return best
         return None
 
@@ -1062,21 +1290,25 @@ class EdlCut(QtCore.QObject):
         diff = edit.id - sg_cut_item["cut_order"]
         if diff == 0:
             score += 1
-        diff = (
-            edit.source_in.to_frame()
-            - edl.Timecode(
-                sg_cut_item["timecode_cut_item_in_text"],
-                sg_cut_item["cut.Cut.fps"],
-            ).to_frame()
-        )
+        # The same CutItem can be scored against multiple edits, e.g. for
+        # repeated Shots, only convert its timecodes to frames once.
+        cut_item_frames = sg_cut_item.get("_timecode_frames")
+        if cut_item_frames is None:
+            cut_item_frames = (
+                edl.Timecode(
+                    sg_cut_item["timecode_cut_item_in_text"],
+                    sg_cut_item["cut.Cut.fps"],
+                ).to_frame(),
+                edl.Timecode(
+                    sg_cut_item["timecode_cut_item_out_text"],
+                    sg_cut_item["cut.Cut.fps"],
+                ).to_frame(),
+            )
+            sg_cut_item["_timecode_frames"] = cut_item_frames
+        diff = edit.source_in.to_frame() - cut_item_frames[0]
         if diff == 0:
             score += 1
-        diff = (
-            edit.source_out.to_frame()
-            - edl.Timecode(
-                sg_cut_item["timecode_cut_item_out_text"], sg_cut_item["cut.Cut.fps"]
-            ).to_frame()
-        )
+        diff = edit.source_out.to_frame() - cut_item_frames[1]
         if diff == 0:
             score += 1
 
@@ -1102,12 +1334,12 @@ class EdlCut(QtCore.QObject):
         """
         title = sgutils.ensure_str(u_title)
         description = sgutils.ensure_str(u_description)
-        self._logger.info("Importing Cut %s" % title)
+        self._logger.info("Importing Cut %s", title)
         self.got_busy.emit(4)
         self.step_done.emit(_SUMMARY_STEP)
         try:
             self._sg_new_cut = self.create_sg_cut(title, description)
-            self.update_sg_shots(update_shots)
+            shot_updates = self.update_sg_shots(update_shots)
             self.progress_changed.emit(1)
             # When testing this app it is time consuming to create
             # all required Versions in PTR. Uncomment the following line to
@@ -1115,7 +1347,7 @@ class EdlCut(QtCore.QObject):
             # handy for testing.
             # self._create_missing_sg_versions()
             self.progress_changed.emit(2)
-            self.create_sg_cut_items(self._sg_new_cut)
+            self.create_sg_cut_items(self._sg_new_cut, shot_updates)
             self.progress_changed.emit(3)
             self._logger.info("Creating note ...")
             self.create_note(
@@ -1127,7 +1359,7 @@ class EdlCut(QtCore.QObject):
             # Go back to summary screen
             self.step_failed.emit(_PROGRESS_STEP)
         else:
-            self._logger.info("Cut %s imported" % title)
+            self._logger.info("Cut %s imported", title)
             # Can go to next step
             self.step_done.emit(_PROGRESS_STEP)
         finally:
@@ -1145,31 +1377,18 @@ class EdlCut(QtCore.QObject):
         :param sg_links: Optional list of Flow Production Tracking Entity dictionaries to link the note to
         """
         summary = self._summary
+        note_links = [self._sg_entity] + (sg_links or [])
+        base_url = self._app.shotgun.base_url
         url_links = [
-            "%s/detail/%s/%s"
-            % (
-                self._app.shotgun.base_url,
-                self._sg_entity["type"],
-                self._sg_entity["id"],
-            )
+            "%s/detail/%s/%s" % (base_url, x["type"], x["id"]) for x in note_links
         ]
-        if sg_links:
-            for sg_link in sg_links:
-                url_links.append(
-                    "%s/detail/%s/%s"
-                    % (
-                        self._app.shotgun.base_url,
-                        sg_link["type"],
-                        sg_link["id"],
-                    )
-                )
         subject, body = summary.get_report(title, url_links)
         contents = "%s\n%s" % (description, body)
         data = {
             "project": self._project,
             "subject": subject,
             "content": contents,
-            "note_links": [self._sg_entity] + (sg_links if sg_links else []),
+            "note_links": note_links,
             "created_by": sender or None,  # Ensure we send None if we got an empty dict
             "user": sender or None,
             "addressings_to": to,
@@ -1189,7 +1408,7 @@ class EdlCut(QtCore.QObject):
         :param description: A string, a description for the Cut
         """
         # Create a new Cut
-        self._logger.info("Creating Cut %s ..." % title)
+        self._logger.info("Creating Cut %s ...", title)
         # If start and end timecodes are not defined, we keep them as-is,
         # so no value will be set when creating the Cut, avoiding getting a 'None'
         # string from str(None).
@@ -1201,17 +1420,16 @@ class EdlCut(QtCore.QObject):
         if tc_end is not None:
             tc_end = str(tc_end)
         # Get a revision number for this Cut, look for Cuts with the same name
-        # linked to the same Entity
-        sg_previous_cut = self._sg.find_one(
+        # linked to the same Entity. This is done in the background while the
+        # base layer Version is created and its media uploaded.
+        sg_previous_cuts_future = self._executor.submit(
+            self._sg_find,
             "Cut",
             [["entity", "is", self._sg_entity], ["code", "is", title]],
             ["revision_number"],
             order=[{"field_name": "revision_number", "direction": "desc"}],
+            limit=1,
         )
-        revision_number = 1
-        if sg_previous_cut and sg_previous_cut["revision_number"]:
-            revision_number = sg_previous_cut["revision_number"] + 1
-
         cut_payload = {
             "project": self._project,
             "code": title,
@@ -1223,7 +1441,6 @@ class EdlCut(QtCore.QObject):
             "timecode_start_text": tc_start,
             "timecode_end_text": tc_end,
             "duration": self._summary.duration,
-            "revision_number": revision_number,
         }
         # Upload base layer media file to the new Cut record if it exists.
         if self._mov_file_path:
@@ -1255,6 +1472,11 @@ class EdlCut(QtCore.QObject):
             )
             # Link the Cut to the version.
             cut_payload["version"] = {"type": "Version", "id": sg_version["id"]}
+        revision_number = 1
+        sg_previous_cuts = sg_previous_cuts_future.result()
+        if sg_previous_cuts and sg_previous_cuts[0]["revision_number"]:
+            revision_number = sg_previous_cuts[0]["revision_number"] + 1
+        cut_payload["revision_number"] = revision_number
         sg_cut = self._sg.create("Cut", cut_payload, ["id", "code"])
         # Upload edl file to the new Cut record and keep going if it fails.
         try:
@@ -1263,8 +1485,9 @@ class EdlCut(QtCore.QObject):
             )
         except Exception as e:
             self._logger.warning(
-                "Couldn't upload %s into Flow Production Tracking: %s"
-                % (self._edl_file_path, e)
+                "Couldn't upload %s into Flow Production Tracking: %s",
+                self._edl_file_path,
+                e,
             )
         return sg_cut
 
@@ -1308,272 +1531,324 @@ class EdlCut(QtCore.QObject):
         - Change their status
         - Update cut in, cut out values
 
+        New Shots are created straight away, so CutItems can be linked to them.
+        Requests for existing Shots are returned, to be sent by
+        create_sg_cut_items ahead of the CutItems creation requests.
+
         :param update_shots: Boolean indicating whether or not Shot fields should be updated
+        :returns: A list of (PTR batch request, CutDiffs list) tuples for the
+                  existing Shots to update
         """
         if update_shots:
             self._logger.info("Updating Shots ...")
         else:
             self._logger.info("Creating new Shots ...")
 
-        omit_status = self._user_settings.retrieve("omit_status")
-        update_shot_statuses = self._user_settings.retrieve("update_shot_statuses")
+        # Statuses to set on Shots, per Shot difference type. Current statuses
+        # are kept for other types.
+        shot_statuses = {}
+        if self._user_settings.retrieve("update_shot_statuses"):
+            shot_statuses[_DIFF_TYPES.OMITTED] = self._user_settings.retrieve(
+                "omit_status"
+            )
+            shot_statuses[_DIFF_TYPES.REINSTATED] = self._user_settings.retrieve(
+                "reinstate_status"
+            )
+        # Methods returning PTR batch requests for a Shot, per Shot difference
+        # type. Entries where the Shot name couldn't be retrieved are skipped.
+        request_builders = {
+            _DIFF_TYPES.NO_LINK: None,
+            _DIFF_TYPES.NEW: self._get_new_shot_requests,
+        }
+        default_request_builder = None
+        # We only update Shots if asked to do so, but we always create Shots if
+        # needed
+        if update_shots:
+            request_builders[_DIFF_TYPES.OMITTED] = self._get_omitted_shot_requests
+            request_builders[
+                _DIFF_TYPES.REINSTATED
+            ] = self._get_reinstated_shot_requests
+            # Cut change or rescan or no change.
+            default_request_builder = self._get_updated_shot_requests
 
         sg_batch_data = []
-        post_create = {}
+        # CutDiffs list for each request in sg_batch_data
+        requests_cut_diffs = []
+        # Requests for existing Shots, with their CutDiffs list
+        shot_updates = []
         # Loop over all Shots that we need to create
         for shot_name, items in self._summary.items():
             # Retrieve values for the shot, and the Shot itself
-            (
-                sg_shot,
-                min_cut_order,
-                min_head_in,
-                min_cut_in,
-                max_cut_out,
-                max_tail_out,
-                shot_diff_type,
-            ) = items.get_shot_values()
-            self._logger.debug(
-                "Shot values for %s are %s"
-                % (
-                    shot_name,
-                    str(
-                        (
-                            min_cut_order,
-                            min_head_in,
-                            min_cut_in,
-                            max_cut_out,
-                            max_tail_out,
-                            shot_diff_type,
-                        )
-                    ),
-                )
+            shot_values = items.get_shot_values()
+            self._logger.debug("Shot values for %s are %s", shot_name, shot_values[1:])
+            shot_diff_type = shot_values[-1]
+            request_builder = request_builders.get(
+                shot_diff_type, default_request_builder
             )
-            # Cut diff types should be the same for all repeated entries except maybe for
-            # rescan / cut changes. However, we do the same thing in both cases, so it doesn't
-            # matter. Head in and tail out values can be evaluated on any repeated Shot
-            # entry so we arbitrarily use the first entry
-            cut_diff = items[0]
-
-            # Skip entries where the Shot name couldn't be retrieved
-            if shot_diff_type == _DIFF_TYPES.NO_LINK:
-                pass
-            elif shot_diff_type == _DIFF_TYPES.NEW:
-                # We always create Shots if needed
-                self._logger.info(
-                    "Will create Shot %s for %s" % (shot_name, self.entity_name)
+            if request_builder:
+                # Cut diff types should be the same for all repeated entries except
+                # maybe for rescan / cut changes. However, we do the same thing in
+                # both cases, so it doesn't matter. Head in and tail out values can
+                # be evaluated on any repeated Shot entry so we arbitrarily use the
+                # first entry
+                sg_requests = request_builder(
+                    items[0], shot_values, shot_statuses.get(shot_diff_type)
                 )
-                data = {
-                    "project": self._project,
-                    "code": cut_diff.name,
-                    "updated_by": self._ctx.user,
-                    "sg_cut_order": min_cut_order,
-                }
-                if self._sg_shot_link_field_name:
-                    data[self._sg_shot_link_field_name] = self._sg_entity
-                data.update(
-                    self._get_shot_in_out_sg_data(
-                        min_head_in,
-                        min_cut_in,
-                        max_cut_out,
-                        max_tail_out,
-                    )
-                )
-                # Smart fields do not behave as expected, so in preparation for
-                # an update to a Shot not yet created, we store the Shot's data
-                # in a dict that will later be used to update smart field values
-                # in a specific order.
-                if self._use_smart_fields:
-                    post_create[data["code"]] = data
-                sg_batch_data.append(
-                    {"request_type": "create", "entity_type": "Shot", "data": data}
-                )
-            # We only update Shots if asked to do so
-            elif update_shots:
-                if shot_diff_type == _DIFF_TYPES.OMITTED:
-                    # Add code in the update so it will be returned with batch results.
-                    sg_batch_data.append(
-                        {
-                            "request_type": "update",
-                            "entity_type": "Shot",
-                            "entity_id": sg_shot["id"],
-                            "data": {
-                                "code": sg_shot["code"],
-                                "sg_status_list": (
-                                    omit_status
-                                    if update_shot_statuses
-                                    else sg_shot["sg_status_list"]
-                                ),
-                            },
-                        }
-                    )
-                elif shot_diff_type == _DIFF_TYPES.REINSTATED:
-                    reinstate_status = self._user_settings.retrieve("reinstate_status")
-                    if reinstate_status == "Previous Status":
-                        # Find the most recent status change event log entry where the
-                        # project and linked Shot code match the current project/shot
-                        filters = [
-                            [
-                                "project",
-                                "is",
-                                {"type": "Project", "id": self._project["id"]},
-                            ],
-                            ["event_type", "is", "Shotgun_Shot_Change"],
-                            ["attribute_name", "is", "sg_status_list"],
-                            ["entity.Shot.id", "is", sg_shot["id"]],
-                        ]
-                        fields = ["meta"]
-                        event_log = self._sg.find_one(
-                            "EventLogEntry",
-                            filters,
-                            fields,
-                            order=[{"field_name": "created_at", "direction": "desc"}],
-                        )
-                        # Set the reinstate status value to the value previous to the
-                        # event log entry
-                        reinstate_status = event_log["meta"]["old_value"]
-                    # Add code in the update so it will be returned with batch results.
-                    data = {
-                        "code": sg_shot["code"],
-                        "sg_cut_order": min_cut_order,
-                        "sg_status_list": (
-                            reinstate_status
-                            if update_shot_statuses
-                            else sg_shot["sg_status_list"]
-                        ),
-                    }
-                    data.update(
-                        self._get_shot_in_out_sg_data(
-                            min_head_in,
-                            min_cut_in,
-                            max_cut_out,
-                            max_tail_out,
-                        )
-                    )
-                    # Smart fields do not behave as expected, this value must be
-                    # set before other cut values to get the right effect.
-                    if self._use_smart_fields:
-                        sg_batch_data.append(
-                            {
-                                "request_type": "update",
-                                "entity_type": "Shot",
-                                "entity_id": sg_shot["id"],
-                                "data": {
-                                    "smart_head_duration": min_cut_in - min_head_in + 1
-                                },
-                            }
-                        )
-                    sg_batch_data.append(
-                        {
-                            "request_type": "update",
-                            "entity_type": "Shot",
-                            "entity_id": sg_shot["id"],
-                            "data": data,
-                        }
-                    )
-                else:
-                    # Cut change or rescan or no change.
-                    # Add code and status in the update so it will be returned
-                    # with batch results.
-                    data = {
-                        "code": sg_shot["code"],
-                        "sg_status_list": sg_shot["sg_status_list"],
-                        "sg_cut_order": min_cut_order,
-                    }
-                    data.update(
-                        self._get_shot_in_out_sg_data(
-                            min_head_in,
-                            min_cut_in,
-                            max_cut_out,
-                            max_tail_out,
-                        )
-                    )
-                    # Smart fields do not behave as expected, this value must be
-                    # set before other cut values to get the right effect.
-                    if self._use_smart_fields:
-                        sg_batch_data.append(
-                            {
-                                "request_type": "update",
-                                "entity_type": "Shot",
-                                "entity_id": sg_shot["id"],
-                                "data": {
-                                    "smart_head_duration": min_cut_in - min_head_in + 1
-                                },
-                            }
-                        )
-                    sg_batch_data.append(
-                        {
-                            "request_type": "update",
-                            "entity_type": "Shot",
-                            "entity_id": sg_shot["id"],
-                            "data": data,
-                        }
-                    )
+                # Keep track of the CutDiffs each request is for, so results
+                # can be bound to them without looking them up by name
+                for sg_request in sg_requests:
+                    if sg_request["request_type"] == "create":
+                        sg_batch_data.append(sg_request)
+                        requests_cut_diffs.append(items)
+                    else:
+                        shot_updates.append((sg_request, items))
+
+        # Smart fields do not behave as expected, so in preparation for
+        # an update to a Shot not yet created, we store the Shot's data
+        # in a dict that will later be used to update smart field values
+        # in a specific order.
+        post_create = {}
+        if self._use_smart_fields:
+            for sg_request in sg_batch_data:
+                post_create[sg_request["data"]["code"]] = sg_request["data"]
 
         if sg_batch_data:
             sg_batch_data_update = []
-            res = self._sg.batch(sg_batch_data)
-            self._logger.info("Created/Updated %d shot(s)." % len(res))
-            # Update cut_diffs with the new Shots
-            for sg_shot in res:
-                # Skip entries without a "code" key coming from the smart fields
-                # workaround
-                if "code" not in sg_shot:
-                    continue
-                shot_code = sg_shot["code"]
-                # Smart fields do not behave as expected, so we gather data from
-                # the current Shot to do a deferred and staggered update; first
-                # we have to set the smart_head_duration field, and after that
-                # we update the other fields. This is inefficient but necessary
-                # and only happens when smart fields are used on newly created Shots.
-                if self._use_smart_fields and sg_shot["code"] in post_create:
-                    sg_batch_data_update.append(
-                        {
-                            "request_type": "update",
-                            "entity_type": "Shot",
-                            "entity_id": sg_shot["id"],
-                            "data": {
-                                "smart_head_duration": (
-                                    post_create[shot_code]["smart_cut_in"]
-                                    - post_create[shot_code]["smart_head_in"]
-                                )
-                            },
-                        }
-                    )
-                    sg_batch_data_update.append(
-                        {
-                            "request_type": "update",
-                            "entity_type": "Shot",
-                            "entity_id": sg_shot["id"],
-                            "data": {
-                                "smart_head_in": post_create[shot_code][
-                                    "smart_head_in"
-                                ],
-                                "smart_cut_in": post_create[shot_code]["smart_cut_in"],
-                                "smart_cut_out": post_create[shot_code][
-                                    "smart_cut_out"
-                                ],
-                                "smart_tail_out": post_create[shot_code][
-                                    "smart_tail_out"
-                                ],
-                            },
-                        }
+            created_count = 0
+            # Update cut_diffs with the new Shots as soon as each chunk is
+            # created, results are in requests order. Results must come first
+            # in zip, so no CutDiffs are consumed once a chunk results are
+            # exhausted.
+            requests_cut_diffs = iter(requests_cut_diffs)
+            for res in self._run_batch_chunks(sg_batch_data):
+                created_count += len(res)
+                for sg_shot, cut_diffs in zip(res, requests_cut_diffs):
+                    self._bind_new_sg_shot(
+                        sg_shot, cut_diffs, post_create, sg_batch_data_update
                     )
-                shot_name = shot_code.lower()
-                if shot_name not in self._summary:
-                    raise RuntimeError(
-                        "Created/Updated Shot %s, but couldn't retrieve it in our list"
-                        % shot_name
-                    )
-                for cut_diff in self._summary[shot_name]:
-                    if cut_diff.sg_shot:
-                        # Update with new values
-                        cut_diff.sg_shot.update(sg_shot)
-                    else:
-                        cut_diff._sg_shot = sg_shot
+            self._logger.info("Created %d shot(s).", created_count)
             if sg_batch_data_update:
                 # Do the deferred update of Shots for smart fields workaround.
-                res = self._sg.batch(sg_batch_data_update)
-                self._logger.info("Updated smart fields on %d shot(s)." % len(res))
+                updated_count = 0
+                for res in self._run_batch_chunks(sg_batch_data_update):
+                    updated_count += len(res)
+                self._logger.info("Updated smart fields on %d shot(s).", updated_count)
+        return shot_updates
+
+    def _bind_new_sg_shot(self, sg_shot, cut_diffs, post_create, sg_batch_data_update):
+        """
+        Set the given newly created PTR Shot on the given CutDiffs, and add
+        the requests needed for the smart fields workaround, if any.
+
+        :param sg_shot: A PTR Shot dictionary, as returned by a batch request
+        :param cut_diffs: A list of CutDiff instances
+        :param post_create: A dictionary of Shot creation data, keyed by Shot
+                            code, for Shots which need the smart fields workaround
+        :param sg_batch_data_update: A list of PTR batch requests, extended with
+                                     the requests needed for this Shot
+        """
+        shot_code = sg_shot["code"]
+        # Smart fields do not behave as expected, so we gather data from
+        # the current Shot to do a deferred and staggered update; first
+        # we have to set the smart_head_duration field, and after that
+        # we update the other fields. This is inefficient but necessary
+        # and only happens when smart fields are used on newly created Shots.
+        shot_data = post_create.get(shot_code)
+        if shot_data:
+            sg_batch_data_update.append(
+                {
+                    "request_type": "update",
+                    "entity_type": "Shot",
+                    "entity_id": sg_shot["id"],
+                    "data": {
+                        "smart_head_duration": (
+                            shot_data["smart_cut_in"] - shot_data["smart_head_in"]
+                        )
+                    },
+                }
+            )
+            sg_batch_data_update.append(
+                {
+                    "request_type": "update",
+                    "entity_type": "Shot",
+                    "entity_id": sg_shot["id"],
+                    "data": {
+                        "smart_head_in": shot_data["smart_head_in"],
+                        "smart_cut_in": shot_data["smart_cut_in"],
+                        "smart_cut_out": shot_data["smart_cut_out"],
+                        "smart_tail_out": shot_data["smart_tail_out"],
+                    },
+                }
+            )
+        self._bind_sg_shot(sg_shot, cut_diffs)
+
+    def _bind_sg_shot(self, sg_shot, cut_diffs):
+        """
+        Set or update the PTR Shot of the given CutDiffs.
+
+        :param sg_shot: A PTR Shot dictionary, as returned by a batch request
+        :param cut_diffs: A list of CutDiff instances
+        """
+        for cut_diff in cut_diffs:
+            if cut_diff.sg_shot:
+                # Update with new values
+                cut_diff.sg_shot.update(sg_shot)
+            else:
+                cut_diff._sg_shot = sg_shot
+
+    def _get_new_shot_requests(self, cut_diff, shot_values, sg_status):
+        """
+        Return PTR batch requests to create a new Shot.
+
+        :param cut_diff: A CutDiff instance for the Shot
+        :param shot_values: A tuple, as returned by ShotCutDiffList.get_shot_values
+        :param sg_status: Unused, new Shots get the default PTR status
+        :returns: A list of PTR batch requests
+        """
+        (
+            sg_shot,
+            min_cut_order,
+            min_head_in,
+            min_cut_in,
+            max_cut_out,
+            max_tail_out,
+            shot_diff_type,
+        ) = shot_values
+        self._logger.info("Will create Shot %s for %s", cut_diff.name, self.entity_name)
+        data = {
+            "project": self._project,
+            "code": cut_diff.name,
+            "updated_by": self._ctx.user,
+            "sg_cut_order": min_cut_order,
+            **self._get_shot_in_out_sg_data(
+                min_head_in,
+                min_cut_in,
+                max_cut_out,
+                max_tail_out,
+            ),
+        }
+        if self._sg_shot_link_field_name:
+            data[self._sg_shot_link_field_name] = self._sg_entity
+        return [{"request_type": "create", "entity_type": "Shot", "data": data}]
+
+    def _get_omitted_shot_requests(self, cut_diff, shot_values, sg_status):
+        """
+        Return PTR batch requests to update an omitted Shot.
+
+        :param cut_diff: A CutDiff instance for the Shot
+        :param shot_values: A tuple, as returned by ShotCutDiffList.get_shot_values
+        :param sg_status: A PTR status to set on the Shot, or None to keep the
+                          current one
+        :returns: A list of PTR batch requests
+        """
+        sg_shot = shot_values[0]
+        # Add code in the update so it will be returned with batch results.
+        return [
+            {
+                "request_type": "update",
+                "entity_type": "Shot",
+                "entity_id": sg_shot["id"],
+                "data": {
+                    "code": sg_shot["code"],
+                    "sg_status_list": sg_status or sg_shot["sg_status_list"],
+                },
+            }
+        ]
+
+    def _get_reinstated_shot_requests(self, cut_diff, shot_values, sg_status):
+        """
+        Return PTR batch requests to update a reinstated Shot.
+
+        :param cut_diff: A CutDiff instance for the Shot
+        :param shot_values: A tuple, as returned by ShotCutDiffList.get_shot_values
+        :param sg_status: A PTR status to set on the Shot, "Previous Status" to
+                          restore the status the Shot had before being omitted,
+                          or None to keep the current one
+        :returns: A list of PTR batch requests
+        """
+        sg_shot = shot_values[0]
+        if sg_status == "Previous Status":
+            # Find the most recent status change event log entry where the
+            # project and linked Shot code match the current project/shot
+            filters = [
+                [
+                    "project",
+                    "is",
+                    {"type": "Project", "id": self._project["id"]},
+                ],
+                ["event_type", "is", "Shotgun_Shot_Change"],
+                ["attribute_name", "is", "sg_status_list"],
+                ["entity.Shot.id", "is", sg_shot["id"]],
+            ]
+            fields = ["meta"]
+            event_log = self._sg.find_one(
+                "EventLogEntry",
+                filters,
+                fields,
+                order=[{"field_name": "created_at", "direction": "desc"}],
+            )
+            # Set the reinstate status value to the value previous to the
+            # event log entry
+            sg_status = event_log["meta"]["old_value"]
+        return self._get_updated_shot_requests(cut_diff, shot_values, sg_status)
+
+    def _get_updated_shot_requests(self, cut_diff, shot_values, sg_status):
+        """
+        Return PTR batch requests to update cut values on an existing Shot.
+
+        :param cut_diff: A CutDiff instance for the Shot
+        :param shot_values: A tuple, as returned by ShotCutDiffList.get_shot_values
+        :param sg_status: A PTR status to set on the Shot, or None to keep the
+                          current one
+        :returns: A possibly empty list of PTR batch requests
+        """
+        (
+            sg_shot,
+            min_cut_order,
+            min_head_in,
+            min_cut_in,
+            max_cut_out,
+            max_tail_out,
+            shot_diff_type,
+        ) = shot_values
+        sg_batch_data = []
+        # Add code and status in the update so it will be returned
+        # with batch results.
+        data = {
+            "code": sg_shot["code"],
+            "sg_status_list": sg_status or sg_shot["sg_status_list"],
+            "sg_cut_order": min_cut_order,
+            **self._get_shot_in_out_sg_data(
+                min_head_in,
+                min_cut_in,
+                max_cut_out,
+                max_tail_out,
+            ),
+        }
+        # Don't update the Shot if it already has all these values
+        if all(k in sg_shot and sg_shot[k] == v for k, v in data.items()):
+            self._logger.debug("Shot %s is already up to date", sg_shot["code"])
+            return []
+        # Smart fields do not behave as expected, this value must be
+        # set before other cut values to get the right effect.
+        if self._use_smart_fields:
+            sg_batch_data.append(
+                {
+                    "request_type": "update",
+                    "entity_type": "Shot",
+                    "entity_id": sg_shot["id"],
+                    "data": {"smart_head_duration": min_cut_in - min_head_in + 1},
+                }
+            )
+        sg_batch_data.append(
+            {
+                "request_type": "update",
+                "entity_type": "Shot",
+                "entity_id": sg_shot["id"],
+                "data": data,
+            }
+        )
+        return sg_batch_data
 
     def _create_missing_sg_versions(self):
         """
@@ -1583,95 +1858,202 @@ class EdlCut(QtCore.QObject):
         # This is not part of production specs, but very handy for developers
         self._logger.info("Updating versions ...")
         sg_batch_data = []
-        for shot_name, items in self._summary.items():
-            requested_names = []
-            for cut_diff in items:
-                edit = cut_diff.edit
-                if edit and not edit.get_sg_version() and edit.get_version_name():
-                    version_name = edit.get_version_name().lower()
-                    if version_name not in requested_names:
-                        sg_batch_data.append(
-                            {
-                                "request_type": "create",
-                                "entity_type": "Version",
-                                "data": {
-                                    "project": self._project,
-                                    "code": edit.get_version_name(),
-                                    "entity": cut_diff.sg_shot,
-                                    "updated_by": self._ctx.user,
-                                    "created_by": self._ctx.user,
-                                },
-                                "return_fields": [
-                                    "entity.Shot.code",
-                                ],
-                            }
-                        )
-                        requested_names.append(version_name)
-        if sg_batch_data:
-            res = self._sg.batch(sg_batch_data)
-            self._logger.info("Created %d new versions." % len(res))
-            for shot_name, items in self._summary.items():
-                # Versions with same names are shared for repeated Shots
-                sg_versions = {}
-                for cut_diff in items:
-                    edit = cut_diff.edit
-                    if edit and not edit.get_sg_version():
-                        version_name = edit.get_version_name().lower()
-                        if version_name not in sg_versions:
-                            # Creation order should match
-                            sg_version = res.pop(0)
-                            if sg_version["code"].lower() != version_name:
-                                raise RuntimeError(
-                                    "Version mismatch, expected %s got %s"
-                                    % (version_name, sg_version["code"].lower())
-                                )
-                            sg_versions[sg_version["code"].lower()] = sg_version
-                        cut_diff.set_sg_version(sg_versions[version_name])
-
-    def create_sg_cut_items(self, sg_cut):
-        """
-        Create the CutItems in Flow Production Tracking, linked to the given Cut
-
-        :param sg_cut: A PTR Cut dictionary
-        """
-        # Loop through all edits and create CutItems for them
-        self._logger.info("Creating Cut Items...")
-        sg_batch_data = []
-        for shot_name, items in self._summary.items():
+        # (lower case Version name, CutDiffs list) tuples for each requested
+        # Version, in requests order
+        requested_versions = []
+        # Values shared by all Versions, merged in each Version data
+        static_data = {
+            "project": self._project,
+            "updated_by": self._ctx.user,
+            "created_by": self._ctx.user,
+        }
+        for items in self._summary.values():
+            # Versions with same names are shared for repeated Shots
+            requested_cut_diffs = {}
             for cut_diff in items:
                 edit = cut_diff.edit
-                if edit:
-                    # note: since we're calculating these values from timecode which is
-                    # inclusive, we have to make it exclusive when going to frames
-                    edit_in = edit.record_in.to_frame() - self._summary.edit_offset + 1
-                    edit_out = edit.record_out.to_frame() - self._summary.edit_offset
+                if edit and not edit._sg_version and edit._version_name:
+                    version_name = edit._version_name.lower()
+                    if version_name in requested_cut_diffs:
+                        requested_cut_diffs[version_name].append(cut_diff)
+                        continue
+                    requested_cut_diffs[version_name] = [cut_diff]
+                    requested_versions.append(
+                        (version_name, requested_cut_diffs[version_name])
+                    )
                     sg_batch_data.append(
                         {
                             "request_type": "create",
-                            "entity_type": "CutItem",
+                            "entity_type": "Version",
                             "data": {
-                                "project": self._project,
-                                "code": edit.reel_name,
-                                "cut": sg_cut,
-                                "description": ", ".join(cut_diff.reasons),
-                                "cut_order": edit.id,
-                                "timecode_cut_item_in_text": str(edit.source_in),
-                                "timecode_cut_item_out_text": str(edit.source_out),
-                                "timecode_edit_in_text": str(edit.record_in),
-                                "timecode_edit_out_text": str(edit.record_out),
-                                "cut_item_in": cut_diff.new_cut_in,
-                                "cut_item_out": cut_diff.new_cut_out,
-                                "edit_in": edit_in,
-                                "edit_out": edit_out,
-                                "cut_item_duration": cut_diff.new_cut_out
-                                - cut_diff.new_cut_in
-                                + 1,
-                                "shot": cut_diff.sg_shot,
-                                "version": cut_diff.sg_version,
-                                "created_by": self._ctx.user,
-                                "updated_by": self._ctx.user,
+                                **static_data,
+                                "code": edit._version_name,
+                                "entity": cut_diff.sg_shot,
                             },
+                            "return_fields": [
+                                "entity.Shot.code",
+                            ],
                         }
                     )
         if sg_batch_data:
-            self._sg.batch(sg_batch_data)
+            created_count = 0
+            # Creation order should match, bind Versions as soon as each chunk
+            # is created. Results must come first in zip, so no requested Version
+            # is consumed once a chunk results are exhausted.
+            requested_versions = iter(requested_versions)
+            for res in self._run_batch_chunks(sg_batch_data):
+                created_count += len(res)
+                for sg_version, (version_name, cut_diffs) in zip(
+                    res, requested_versions
+                ):
+                    if sg_version["code"].lower() != version_name:
+                        raise RuntimeError(
+                            "Version mismatch, expected %s got %s"
+                            % (version_name, sg_version["code"].lower())
+                        )
+                    for cut_diff in cut_diffs:
+                        cut_diff.set_sg_version(sg_version)
+            self._logger.info("Created %d new versions.", created_count)
+
+    def create_sg_cut_items(self, sg_cut, shot_updates=None):
+        """
+        Create the CutItems in Flow Production Tracking, linked to the given Cut
+
+        Requests to update existing Shots are sent first, in their own batches,
+        and their results are bound to their CutDiffs before CutItems are
+        created.
+
+        CutItems are created in chunks, each chunk being a separate PTR
+        transaction. If a chunk fails, the CutItems already created and the
+        Cut are deleted, so no partial Cut is left in PTR.
+
+        :param sg_cut: A PTR Cut dictionary
+        :param shot_updates: An optional list of (PTR batch request, CutDiffs list)
+                             tuples, as returned by update_sg_shots
+        """
+        # Ids of the CutItems created so far
+        sg_cut_item_ids = []
+        try:
+            if shot_updates:
+                self._run_sg_shot_updates(shot_updates)
+            # Loop through all edits and create CutItems for them
+            self._logger.info("Creating Cut Items...")
+            # CutItem requests are built while chunks are created, so only a
+            # chunk of requests is held at a time.
+            for i, res in enumerate(
+                self._run_batch_chunks(self._get_cut_item_requests(sg_cut))
+            ):
+                sg_cut_item_ids.extend(x["id"] for x in res)
+                self._logger.debug(
+                    "Created Cut Items chunk %d with %d Cut Item(s).", i + 1, len(res)
+                )
+        except Exception:
+            self._discard_sg_cut(sg_cut, sg_cut_item_ids)
+            raise
+        self._logger.info("Created %d Cut Item(s).", len(sg_cut_item_ids))
+
+    def _discard_sg_cut(self, sg_cut, sg_cut_item_ids):
+        """
+        Delete the given PTR Cut and CutItems, after a failure while creating
+        them.
+
+        Errors are logged but not raised, so they don't hide the original one.
+
+        :param sg_cut: A PTR Cut dictionary
+        :param sg_cut_item_ids: A list of PTR CutItem ids
+        """
+        self._logger.warning(
+            "Deleting Cut %s and %d Cut Item(s) created for it...",
+            sg_cut["id"],
+            len(sg_cut_item_ids),
+        )
+        sg_requests = [
+            {"request_type": "delete", "entity_type": "CutItem", "entity_id": x}
+            for x in sg_cut_item_ids
+        ]
+        sg_requests.append(
+            {"request_type": "delete", "entity_type": "Cut", "entity_id": sg_cut["id"]}
+        )
+        try:
+            # Chunks are only sent as results are consumed
+            for _ in self._run_batch_chunks(sg_requests):
+                pass
+        except Exception as e:
+            self._logger.error(
+                "Couldn't delete Cut %s and its Cut Items: %s", sg_cut["id"], e
+            )
+        else:
+            if self._sg_new_cut is sg_cut:
+                self._sg_new_cut = None
+
+    def _run_sg_shot_updates(self, shot_updates):
+        """
+        Run the given requests to update existing Shots, and bind the results
+        to their CutDiffs as soon as each chunk of requests succeeded.
+
+        :param shot_updates: A list of (PTR batch request, CutDiffs list) tuples,
+                             as returned by update_sg_shots
+        """
+        updated_count = 0
+        # Results must come first in zip, so no request is consumed once a
+        # chunk results are exhausted.
+        requests_cut_diffs = iter(shot_updates)
+        for res in self._run_batch_chunks(sg_request for sg_request, _ in shot_updates):
+            for sg_shot, (sg_request, cut_diffs) in zip(res, requests_cut_diffs):
+                # Skip entries without a "code" key coming from the smart fields
+                # workaround
+                if "code" in sg_shot:
+                    updated_count += 1
+                    self._bind_sg_shot(sg_shot, cut_diffs)
+        self._logger.info("Updated %d shot(s).", updated_count)
+
+    def _get_cut_item_requests(self, sg_cut):
+        """
+        Yield PTR batch requests to create a CutItem for each edit, linked to
+        the given Cut.
+
+        :param sg_cut: A PTR Cut dictionary
+        :yields: PTR batch requests
+        """
+        edit_offset = self._summary.edit_offset
+        # Values shared by all CutItems, merged in each CutItem data
+        static_data = {
+            "project": self._project,
+            "cut": sg_cut,
+            "created_by": self._ctx.user,
+            "updated_by": self._ctx.user,
+        }
+        for items in self._summary.values():
+            for cut_diff in items:
+                edit = cut_diff.edit
+                if not edit:
+                    continue
+                # note: since we're calculating these values from timecode which is
+                # inclusive, we have to make it exclusive when going to frames
+                edit_in = edit.record_in.to_frame() - edit_offset + 1
+                edit_out = edit.record_out.to_frame() - edit_offset
+                # New cut values are computed from timecodes and siblings
+                # on each access, only retrieve them once.
+                cut_in = cut_diff.new_cut_in
+                cut_out = cut_diff.new_cut_out
+                yield {
+                    "request_type": "create",
+                    "entity_type": "CutItem",
+                    "data": {
+                        **static_data,
+                        "code": edit.reel_name,
+                        "description": ", ".join(cut_diff.reasons),
+                        "cut_order": edit.id,
+                        "timecode_cut_item_in_text": str(edit.source_in),
+                        "timecode_cut_item_out_text": str(edit.source_out),
+                        "timecode_edit_in_text": str(edit.record_in),
+                        "timecode_edit_out_text": str(edit.record_out),
+                        "cut_item_in": cut_in,
+                        "cut_item_out": cut_out,
+                        "edit_in": edit_in,
+                        "edit_out": edit_out,
+                        "cut_item_duration": cut_out - cut_in + 1,
+                        "shot": cut_diff.sg_shot,
+                        "version": cut_diff.sg_version,
+                    },
+                }
@@ -84,43 +84,55 @@ class EntitiesView(QtCore.QObject):
             return self._selected_entity_card.sg_entity
         return None
 
-    @QtCore.Slot(dict)
-    def new_sg_entity(self, sg_entity):
+    @QtCore.Slot(list)
+    def new_sg_entities(self, sg_entities):
         """
-        Called when a new Entity card widget needs to be added to the list
+        Called when new Entity card widgets need to be added to the list
         of retrieved Entities
 
-        :param sg_entity: A PTR Entity dictionary
+        All cards are added with updates disabled on the parent widget, so the
+        layout is only refreshed once.
+
+        :param sg_entities: A list of PTR Entity dictionaries
         """
-        if sg_entity["type"] != self._sg_entity_type:
+        sg_entities = [x for x in sg_entities if x["type"] == self._sg_entity_type]
+        if not sg_entities:
             # Not for this view which only display another type of Entities
             return
-
-        i = self.card_count
-
-        # Remove it
-        spacer = self._grid_layout.takeAt(i)
-        row = i / 2
-        column = i % 2
-        self._logger.debug("Adding %s at %d %d %d" % (sg_entity, i, row, column))
-        widget = EntityCard(None, sg_entity)
-        widget.entity_type = sg_entity["type"]
-        widget.highlight_selected.connect(self.entity_selected)
-        widget.chosen.connect(self.entity_chosen)
-        self._grid_layout.addWidget(
-            widget,
-            row,
-            column,
-        )
-        self._grid_layout.setRowStretch(row, 0)
-        # Put the stretcher back
-        self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
-        self._grid_layout.setRowStretch(row + 1, 1)
-        count = i + 1
+        parent_widget = self._grid_layout.parentWidget()
+        if parent_widget:
+            parent_widget.setUpdatesEnabled(False)
+        try:
+            i = self.card_count
+            # Remove the stretcher
+            spacer = self._grid_layout.takeAt(i)
+            for sg_entity in sg_entities:
+                row = i // 2
+                column = i % 2
+                self._logger.debug("Adding %s at %d %d %d", sg_entity, i, row, column)
+                widget = EntityCard(None, sg_entity)
+                widget.entity_type = sg_entity["type"]
+                widget.highlight_selected.connect(self.entity_selected)
+                widget.chosen.connect(self.entity_chosen)
+                self._grid_layout.addWidget(
+                    widget,
+                    row,
+                    column,
+                )
+                self._grid_layout.setRowStretch(row, 0)
+                i += 1
+            # Put the stretcher back
+            row = (i - 1) // 2
+            self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
+            self._grid_layout.setRowStretch(row + 1, 1)
+        finally:
+            if parent_widget:
+                parent_widget.setUpdatesEnabled(True)
+        count = i
         self._info_message = (
-            ("%d %ss" % (count, sg_entity["type"]))
+            ("%d %ss" % (count, self._sg_entity_type))
             if count > 1
-            else ("%d %s" % (count, sg_entity["type"]))
+            else ("%d %s" % (count, self._sg_entity_type))
         )
         self.new_info_message.emit(self._info_message)
 
@@ -134,11 +146,11 @@ class EntitiesView(QtCore.QObject):
         """
         if self._selected_entity_card:
             self._selected_entity_card.unselect()
-            self._logger.debug("Unselected %s" % self._selected_entity_card)
+            self._logger.debug("Unselected %s", self._selected_entity_card)
         self._selected_entity_card = card
         self._selected_entity_card.select()
         self.selection_changed.emit(card.sg_entity)
-        self._logger.debug("Selected %s" % self._selected_entity_card)
+        self._logger.debug("Selected %s", self._selected_entity_card)
 
     @QtCore.Slot(str)
     def search(self, u_text):
@@ -149,7 +161,7 @@ class EntitiesView(QtCore.QObject):
         :param u_text: A unicode string to match
         """
         text = sgutils.ensure_str(u_text)
-        self._logger.debug("Searching for %s" % text)
+        self._logger.debug("Searching for %s", text)
         count = self.card_count
         if not count:
             # Avoid 0 Entities message to be emitted if we don't have
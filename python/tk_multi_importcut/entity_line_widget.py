@@ -74,11 +74,13 @@ class EntityLineWidget(QtGui.QLineEdit):
         :param name: A property name
         :param value: The value to set
         """
+        # Only refresh styling if the value actually changed
+        if self.property(name) == value:
+            return
         self.setProperty(name, value)
         # We are using a custom property in style sheets
-        # we need to force a style sheet re-computation with
-        # unpolish / polish
-        self.style().unpolish(self)
+        # we need to force a style sheet re-computation. Polishing clears the
+        # style sheet caches for this widget, so no explicit unpolish is needed
         self.style().polish(self)
 
     def focusInEvent(self, event):
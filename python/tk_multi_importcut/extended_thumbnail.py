@@ -30,6 +30,9 @@ class ExtendedThumbnail(QtGui.QLabel):
         self._text = text or ""
         self._color = None
         self._strike_through = False
+        # Brush used to draw the overlay, and the rgb value it was built from
+        self._brush = None
+        self._brush_rgb = None
 
     def set_text(self, text, color, strike_through=False):
         """
@@ -42,9 +45,34 @@ class ExtendedThumbnail(QtGui.QLabel):
         self._text = str(text)
         if color:
             self._color = QtGui.QColor(color)
+            self._update_brush(self._color)
         self._strike_through = strike_through
         self.update()
 
+    def _update_brush(self, color):
+        """
+        Build the brush used to fill the overlay from the given color, if
+        needed.
+
+        The brush color is a darker version of the given color, with a 0.1
+        scale factor applied to each channel, and half transparent.
+
+        :param color: A QColor
+        """
+        rgb = color.rgb() & 0xFFFFFF
+        if rgb == self._brush_rgb:
+            return
+        self._brush_rgb = rgb
+        self._brush = QtGui.QBrush(
+            QtGui.QColor(
+                ((rgb >> 16) & 0xFF) // 10,
+                ((rgb >> 8) & 0xFF) // 10,
+                (rgb & 0xFF) // 10,
+                128,
+            ),
+            QtCore.Qt.SolidPattern,
+        )
+
     def paintEvent(self, event):
         """
         Override QLabel paintEvent
@@ -73,16 +101,10 @@ class ExtendedThumbnail(QtGui.QLabel):
         painter.setFont(self.font())
         if self._color:
             painter.setPen(self._color)
-        brush = QtGui.QBrush(
-            QtGui.QColor(
-                painter.pen().color().red() * 0.1,
-                painter.pen().color().green() * 0.1,
-                painter.pen().color().blue() * 0.1,
-                128,
-            ),
-            QtCore.Qt.SolidPattern,
-        )
-        painter.setBrush(brush)
+        else:
+            # The default pen color comes from the palette, which can change
+            self._update_brush(painter.pen().color())
+        painter.setBrush(self._brush)
         #        if self._strike_through:
         #            painter.fillRect(self.rect(), QtGui.QBrush(self._color, QtCore.Qt.BDiagPattern))
         #            painter.drawLine(0.0, 0.0, self.rect().width(), self.rect().height() )
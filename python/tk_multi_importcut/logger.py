@@ -9,21 +9,31 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 import sgtk
 import logging
+import threading
 import traceback
 from sgtk.platform.qt import QtCore
 
 
-def get_logger():
+def _get_logger_name():
     """
-    Return a logger for this app
+    Return the name of the logger for this app
     """
     logger_parts = __name__.split(".")
     if len(logger_parts) > 1:
         # Remove the last part which should be this file name
-        logger_name = ".".join(logger_parts[:-1])
-    else:
-        logger_name = logger_parts[0]
-    return logging.getLogger(logger_name)
+        return ".".join(logger_parts[:-1])
+    return logger_parts[0]
+
+
+# The logger name only depends on this module name, so it is computed once
+_LOGGER = logging.getLogger(_get_logger_name())
+
+
+def get_logger():
+    """
+    Return a logger for this app
+    """
+    return _LOGGER
 
 
 class ShortNameFilter(logging.Filter):
@@ -59,8 +69,24 @@ class BundleLogHandler(logging.StreamHandler):
     """
     A logging Handler to log messages with the app log_xxxx methods and emit
     messages through Qt Signals
+
+    Records are buffered and dispatched in batches from the thread the handler
+    was created in, typically the main UI thread, so threads producing log
+    messages are not blocked by Qt Signals or log_xxxx calls.
     """
 
+    # Delay, in milliseconds, between the first buffered record and the flush
+    _FLUSH_DELAY = 100
+
+    # Bundle log_xxxx method names for logging levels
+    _LEVEL_METHODS = {
+        logging.DEBUG: "log_debug",
+        logging.INFO: "log_info",
+        logging.WARNING: "log_warning",
+        logging.ERROR: "log_error",
+        logging.CRITICAL: "log_error",
+    }
+
     class _QtEmitter(QtCore.QObject):
         """
         As BundleLogHandler does not derive from a QObject, we need a small
@@ -73,9 +99,22 @@ class BundleLogHandler(logging.StreamHandler):
         new_message = QtCore.Signal(int, str)
         # Emitted when an error was reported with some exc_info
         new_error_with_exc_info = QtCore.Signal(str, list)
+        # Emitted when records were buffered and a flush should be scheduled
+        flush_requested = QtCore.Signal()
 
         def __init__(self):
             QtCore.QObject.__init__(self)
+            self.flush_timer = QtCore.QTimer(self)
+            self.flush_timer.setSingleShot(True)
+            self.flush_requested.connect(self.schedule_flush)
+
+        @QtCore.Slot()
+        def schedule_flush(self):
+            """
+            Start the flush timer, if not already running
+            """
+            if not self.flush_timer.isActive():
+                self.flush_timer.start(BundleLogHandler._FLUSH_DELAY)
 
     def __init__(self, bundle, *args, **kwargs):
         """
@@ -87,7 +126,22 @@ class BundleLogHandler(logging.StreamHandler):
         """
         super(BundleLogHandler, self).__init__(*args, **kwargs)
         self._bundle = bundle
+        # Dispatch messages to standard TK log_xxxx methods, except when the
+        # current engine is tk-shotgun or tk-desktop:
+        # - tk-shotgun : messages are displayed in a pop up window after
+        #                the app is closed, which is confusing
+        # - tk-desktop : messages are sent through a pipe to the desktop server
+        #                and are logged in the tk-desktop log. We have our own
+        #                logging file and sometimes tk-desktop will hang when
+        #                writing data, so don't log anything
+        engine = sgtk.platform.current_engine()
+        self._dispatch_to_bundle = bool(bundle) and not (
+            engine and engine.name in ("tk-shotgun", "tk-desktop")
+        )
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
         self._qt_emitter = self._QtEmitter()
+        self._qt_emitter.flush_timer.timeout.connect(self.flush)
 
     @property
     def new_message(self):
@@ -107,39 +161,79 @@ class BundleLogHandler(logging.StreamHandler):
 
     def emit(self, record):
         """
-        Emit the given record
-
-        If the record has some exec info, the new_error_with_exc_info signal will
-        be emitted. If not, new_message will be emitted.
+        Buffer the given record, it will be dispatched with the next flush.
 
         :param record: A standard logging record
         """
+        # Format the message now, arguments could be changed before the flush.
+        # Formatting tracebacks is deferred to the flush, so it does not
+        # happen in the thread which produced the record.
+        try:
+            message = record.getMessage()
+        except Exception:
+            self.handleError(record)
+            return
+        with self._buffer_lock:
+            self._buffer.append((record.levelno, message, record.exc_info))
+            first = len(self._buffer) == 1
+        if first:
+            # Only ask for a flush for the first buffered record
+            self._qt_emitter.flush_requested.emit()
+
+    def flush(self):
+        """
+        Dispatch all buffered records.
+
+        If a record has some exec info, the new_error_with_exc_info signal will
+        be emitted. Otherwise, new_message is emitted for the last record only,
+        as previous ones would be immediately replaced by it.
+
+        Messages are sent to the bundle log_xxxx methods, consecutive messages
+        with the same level being joined together.
+
+        Messages were formatted a single time, when records were buffered, and
+        are reused as is for the Qt signals and the bundle log_xxxx methods.
+        """
+        with self._buffer_lock:
+            records = self._buffer
+            self._buffer = []
+        if not records:
+            return
         # Emit one of our signals, depending on if we have a traceback or not, so
         # listeners can log or display the message
-        if record.exc_info is not None:
-            self.new_error_with_exc_info.emit(
-                record.getMessage(), traceback.format_tb(record.exc_info[2])
-            )
-            return
-        self.new_message.emit(record.levelno, record.getMessage())
-        if self._bundle:
-            # Dispatch message to standard TK log_xxxx methods, except when the
-            # current engine is tk-shotgun or tk-desktop:
-            # - tk-shotgun : messages are displayed in a pop up window after
-            #                the app is closed, which is confusing
-            # - tk-desktop : messages are sent through a pipe to the desktop server
-            #                and are logged in the tk-desktop log. We have our own
-            #                logging file and sometimes tk-desktop will hang when
-            #                writing data, so don't log anything
-            engine_name = sgtk.platform.current_engine().name
-            if engine_name == "tk-shotgun" or engine_name == "tk-desktop":
-                return
-            # Pick up the right framework method, given the record level
-            if record.levelno == logging.INFO:
-                self._bundle.log_info(record.getMessage())
-            elif record.levelno == logging.INFO:
-                self._bundle.log_debug(record.getMessage())
-            elif record.levelno == logging.WARNING:
-                self._bundle.log_warning(record.getMessage())
-            elif record.levelno in [logging.ERROR, logging.CRITICAL]:
-                self._bundle.log_error(record.getMessage())
+        last_message = None
+        for levelno, message, exc_info in records:
+            if exc_info is not None:
+                self.new_error_with_exc_info.emit(
+                    message, traceback.format_tb(exc_info[2])
+                )
+            else:
+                last_message = (levelno, message)
+        if last_message:
+            self.new_message.emit(*last_message)
+        if self._dispatch_to_bundle:
+            messages = []
+            current_level = None
+            for levelno, message, exc_info in records:
+                if exc_info is not None:
+                    continue
+                if levelno != current_level and messages:
+                    self._log_to_bundle(current_level, "\n".join(messages))
+                    messages = []
+                current_level = levelno
+                messages.append(message)
+            if messages:
+                self._log_to_bundle(current_level, "\n".join(messages))
+
+    def _log_to_bundle(self, levelno, message):
+        """
+        Log the given message with the bundle log_xxxx method matching the
+        given level.
+
+        :param levelno: A standard logging level
+        :param message: A string
+        """
+        # Pick up the right framework method, given the record level
+        method_name = self._LEVEL_METHODS.get(levelno)
+        if method_name:
+            getattr(self._bundle, method_name)(message)
@@ -49,14 +49,14 @@ class Processor(QtCore.QThread):
     step_done = QtCore.Signal(int)
     step_failed = QtCore.Signal(int)
     set_sg_project = QtCore.Signal(dict)
-    new_sg_project = QtCore.Signal(dict)
-    new_sg_entity = QtCore.Signal(dict)
-    new_sg_cut = QtCore.Signal(dict)
+    new_sg_projects = QtCore.Signal(list)
+    new_sg_entities = QtCore.Signal(list)
+    new_sg_cuts = QtCore.Signal(list)
     retrieve_projects = QtCore.Signal()
     retrieve_entities = QtCore.Signal(str)
     retrieve_cuts = QtCore.Signal(dict)
     show_cut_diff = QtCore.Signal(dict)
-    new_cut_diff = QtCore.Signal(CutDiff)
+    cut_diffs_ready = QtCore.Signal()
     got_busy = QtCore.Signal(int)
     got_idle = QtCore.Signal()
     progress_changed = QtCore.Signal(int)
@@ -243,6 +243,16 @@ class Processor(QtCore.QThread):
         """
         return self._edl_cut.had_valid_movie
 
+    def take_pending_cut_diffs(self):
+        """
+        Return all CutDiffs which became available since the last call
+
+        :returns: A possibly empty list of CutDiff instances
+        """
+        if self._edl_cut:
+            return self._edl_cut.take_pending_cut_diffs()
+        return []
+
     def run(self):
         """
         Run the processor
@@ -255,32 +265,62 @@ class Processor(QtCore.QThread):
         self._edl_cut = EdlCut(frame_rate=self._frame_rate)
         # Connect signals from the worker to ours as a gateway, so anything
         # connected to the Processor signals will be connected to the worker.
-        # Orders we receive
-        self.new_edl.connect(self._edl_cut.load_edl)
-        self.new_movie.connect(self._edl_cut.register_movie_path)
-        self.reset.connect(self._edl_cut.reset)
-        self.retrieve_projects.connect(self._edl_cut.retrieve_projects)
-        self.set_sg_project.connect(self._edl_cut.set_sg_project)
-        self.retrieve_entities.connect(self._edl_cut.retrieve_entities)
-        self.retrieve_cuts.connect(self._edl_cut.retrieve_cuts)
-        self.show_cut_diff.connect(self._edl_cut.show_cut_diff)
-        self.import_cut.connect(self._edl_cut.do_cut_import)
-        self.reload_step.connect(self._edl_cut.reload_step)
-        # Results / orders we send
-        self._edl_cut.step_done.connect(self.step_done)
-        self._edl_cut.step_failed.connect(self.step_failed)
-        self._edl_cut.new_sg_project.connect(self.new_sg_project)
-        self._edl_cut.new_sg_entity.connect(self.new_sg_entity)
-        self._edl_cut.new_sg_cut.connect(self.new_sg_cut)
-        self._edl_cut.new_cut_diff.connect(self.new_cut_diff)
-        self._edl_cut.delete_cut_diff.connect(self.delete_cut_diff)
-        self._edl_cut.got_busy.connect(self.got_busy)
-        self._edl_cut.got_idle.connect(self.got_idle)
-        self._edl_cut.progress_changed.connect(self.progress_changed)
-        self._edl_cut.totals_changed.connect(self.totals_changed)
-        self._edl_cut.valid_edl.connect(self.valid_edl)
-        self._edl_cut.has_transitions.connect(self.has_transitions)
-        self._edl_cut.valid_movie.connect(self.valid_movie)
+        # Orders we receive, they are emitted from other threads and queued
+        # to be processed by the worker in this thread.
+        self.new_edl.connect(self._edl_cut.load_edl, QtCore.Qt.QueuedConnection)
+        self.new_movie.connect(
+            self._edl_cut.register_movie_path, QtCore.Qt.QueuedConnection
+        )
+        self.reset.connect(self._edl_cut.reset, QtCore.Qt.QueuedConnection)
+        self.retrieve_projects.connect(
+            self._edl_cut.retrieve_projects, QtCore.Qt.QueuedConnection
+        )
+        self.set_sg_project.connect(
+            self._edl_cut.set_sg_project, QtCore.Qt.QueuedConnection
+        )
+        self.retrieve_entities.connect(
+            self._edl_cut.retrieve_entities, QtCore.Qt.QueuedConnection
+        )
+        self.retrieve_cuts.connect(
+            self._edl_cut.retrieve_cuts, QtCore.Qt.QueuedConnection
+        )
+        self.show_cut_diff.connect(
+            self._edl_cut.show_cut_diff, QtCore.Qt.QueuedConnection
+        )
+        self.import_cut.connect(self._edl_cut.do_cut_import, QtCore.Qt.QueuedConnection)
+        self.reload_step.connect(self._edl_cut.reload_step, QtCore.Qt.QueuedConnection)
+        # Results / orders we send. The worker emits them from this thread,
+        # re-emit them directly, listeners connected to our signals will get
+        # them queued if they live in other threads.
+        self._edl_cut.step_done.connect(self.step_done, QtCore.Qt.DirectConnection)
+        self._edl_cut.step_failed.connect(self.step_failed, QtCore.Qt.DirectConnection)
+        self._edl_cut.new_sg_projects.connect(
+            self.new_sg_projects, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.new_sg_entities.connect(
+            self.new_sg_entities, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.new_sg_cuts.connect(self.new_sg_cuts, QtCore.Qt.DirectConnection)
+        self._edl_cut.cut_diffs_ready.connect(
+            self.cut_diffs_ready, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.delete_cut_diff.connect(
+            self.delete_cut_diff, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.got_busy.connect(self.got_busy, QtCore.Qt.DirectConnection)
+        self._edl_cut.got_idle.connect(self.got_idle, QtCore.Qt.DirectConnection)
+        self._edl_cut.progress_changed.connect(
+            self.progress_changed, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.totals_changed.connect(
+            self.totals_changed, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.valid_edl.connect(self.valid_edl, QtCore.Qt.DirectConnection)
+        self._edl_cut.has_transitions.connect(
+            self.has_transitions, QtCore.Qt.DirectConnection
+        )
+        self._edl_cut.valid_movie.connect(self.valid_movie, QtCore.Qt.DirectConnection)
         # Tell the outside world we are ready to process things
         self.ready.emit()
         self.exec_()
+        self._edl_cut.shutdown()
@@ -62,37 +62,52 @@ class ProjectsView(QtCore.QObject):
         """
         return self._info_message
 
-    @QtCore.Slot(dict)
-    def new_sg_project(self, sg_project):
+    @QtCore.Slot(list)
+    def new_sg_projects(self, sg_projects):
         """
-        Called when a new Project card widget needs to be added to the list
+        Called when new Project card widgets need to be added to the list
         of retrieved Projects
 
-        :param sg_project: A PTR Project dictionary
-        """
-        i = self.card_count
-        # Remove it
-        spacer = self._grid_layout.takeAt(i)
-        row = i / 2
-        column = i % 2
-        self._logger.debug("Adding %s at %d %d %d" % (sg_project, i, row, column))
-        widget = ProjectCard(parent=None, sg_project=sg_project)
-        widget.highlight_selected.connect(self.project_selected)
-        widget.chosen.connect(self.project_chosen)
-        self._grid_layout.addWidget(
-            widget,
-            row,
-            column,
-        )
-        self._grid_layout.setRowStretch(row, 0)
-        # Put the stretcher back
-        self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
-        self._grid_layout.setRowStretch(row + 1, 1)
-        count = i + 1
+        All cards are added with updates disabled on the parent widget, so the
+        layout is only refreshed once.
+
+        :param sg_projects: A list of PTR Project dictionaries
+        """
+        if not sg_projects:
+            return
+        parent_widget = self._grid_layout.parentWidget()
+        if parent_widget:
+            parent_widget.setUpdatesEnabled(False)
+        try:
+            i = self.card_count
+            # Remove the stretcher
+            spacer = self._grid_layout.takeAt(i)
+            for sg_project in sg_projects:
+                row = i // 2
+                column = i % 2
+                self._logger.debug("Adding %s at %d %d %d", sg_project, i, row, column)
+                widget = ProjectCard(parent=None, sg_project=sg_project)
+                widget.highlight_selected.connect(self.project_selected)
+                widget.chosen.connect(self.project_chosen)
+                self._grid_layout.addWidget(
+                    widget,
+                    row,
+                    column,
+                )
+                self._grid_layout.setRowStretch(row, 0)
+                i += 1
+            # Put the stretcher back
+            row = (i - 1) // 2
+            self._grid_layout.addItem(spacer, row + 1, 0, columnSpan=2)
+            self._grid_layout.setRowStretch(row + 1, 1)
+        finally:
+            if parent_widget:
+                parent_widget.setUpdatesEnabled(True)
+        count = i
         self._info_message = (
-            ("%d %ss" % (count, sg_project["type"]))
+            ("%d %ss" % (count, sg_projects[0]["type"]))
             if count > 1
-            else ("%d %s" % (count, sg_project["type"]))
+            else ("%d %s" % (count, sg_projects[0]["type"]))
         )
         self.new_info_message.emit(self._info_message)
 
@@ -106,11 +121,11 @@ class ProjectsView(QtCore.QObject):
         """
         if self._selected_project_card:
             self._selected_project_card.unselect()
-            self._logger.debug("Unselected %s" % self._selected_project_card)
+            self._logger.debug("Unselected %s", self._selected_project_card)
         self._selected_project_card = card
         self._selected_project_card.select()
         self.selection_changed.emit(card.sg_project)
-        self._logger.debug("Selected %s" % self._selected_project_card)
+        self._logger.debug("Selected %s", self._selected_project_card)
 
     @QtCore.Slot(str)
     def search(self, u_text):
@@ -121,7 +136,7 @@ class ProjectsView(QtCore.QObject):
         :param u_text: A unicode string to match
         """
         text = sgutils.ensure_str(u_text)
-        self._logger.debug("Searching for %s" % text)
+        self._logger.debug("Searching for %s", text)
         count = self.card_count
         if not count:
             # Avoid 0 projects message to be emitted if we don't have
@@ -526,7 +526,7 @@ class SettingsDialog(QtGui.QDialog):
         self._save_settings(new_values)
         if affected:
             # Notify listeners that some wizard steps must be reloaded
-            self._logger.debug("Resetting %s" % affected)
+            self._logger.debug("Resetting %s", affected)
             self.reset_needed.emit(affected)
         return True
 
@@ -535,6 +535,6 @@ class SettingsDialog(QtGui.QDialog):
         Save user settings.
         :param new_values: A dictionary with the new values
         """
-        self._logger.debug("New values %s" % new_values)
+        self._logger.debug("New values %s", new_values)
         self._user_settings.save(new_values)
         self._logger.info("User settings saved.")
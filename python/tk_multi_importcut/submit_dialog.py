@@ -101,8 +101,10 @@ class SubmitDialog(QtGui.QDialog):
             found = False
             for existing_email_group in existing_email_groups:
                 self._logger.debug(
-                    'Comparing "%s" (%s) to "%s"'
-                    % (email_group, type(email_group), existing_email_group["code"])
+                    'Comparing "%s" (%s) to "%s"',
+                    email_group,
+                    type(email_group),
+                    existing_email_group["code"],
                 )
                 if email_group == existing_email_group["code"]:
                     found = True